@@ -1,4 +1,5 @@
 import argparse
+import os
 import pathlib
 import shutil
 import sys
@@ -23,6 +24,9 @@ def main():
                                 nargs='+',
                                 choices=[lang.name for lang in SUPPORTED_LANGUAGES])
     arg_parser.add_argument("--clean", action="store_true", help="Delete the output directory before regenerating code.")
+    arg_parser.add_argument("--cache-dir", default=None, help="The directory of the parsed-schema cache (defaults to the user cache directory).")
+    arg_parser.add_argument("--python-ext", action="store_true", help="Also generate a CPython extension module wrapping the generated C code.")
+    arg_parser.add_argument("--no-cache", action="store_true", help="Parse and validate every schema file, without using the parsed-schema cache.")
     args = arg_parser.parse_args()
 
     protoc_file_path = pathlib.Path(args.filepath).resolve().absolute()
@@ -36,7 +40,17 @@ def main():
     else:
         selected_languages = [lang for lang in SUPPORTED_LANGUAGES if lang.name in args.lang]
 
-    compiler = Generator(TEMPLATE_DIR, selected_languages)
+    if args.no_cache:
+        cache_dir = None
+    elif args.cache_dir:
+        cache_dir = pathlib.Path(args.cache_dir).resolve().absolute()
+    else:
+        cache_dir = pathlib.Path(os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache")) / "beta_protoc"
+
+    if args.python_ext and Generator.PYTHON_EXTENSION_LANG not in [lang.name for lang in selected_languages]:
+        sys.exit(f"Error: --python-ext requires the {Generator.PYTHON_EXTENSION_LANG} language to be generated.")
+
+    compiler = Generator(TEMPLATE_DIR, selected_languages, cache_dir, args.python_ext)
 
     out_dir = pathlib.Path(args.out).resolve().absolute()
 
@@ -53,7 +67,8 @@ def main():
         details = "\n".join(
             [f"\t- in {loc_to_path(err.loc, e.json_data)}: {err.message}" for err in e.errors]
         )
-        sys.exit(f"Error: JSON parsing error:\n{details}")
+        in_file = f" in '{e.file}'" if e.file else ""
+        sys.exit(f"Error: JSON parsing error{in_file}:\n{details}")
     except MissingTypeError as e:
         sys.exit(f"Error: {e.type} is not defined for {e.lang.name} language.")
 
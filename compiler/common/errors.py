@@ -1,4 +1,5 @@
-from typing import Dict, List, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
+import pathlib
 
 if TYPE_CHECKING:
     from compiler.core.language import Language
@@ -16,10 +17,14 @@ class JSONParsingErrorDetails:
         self.loc = loc
 
 class JSONParsingErrors(Exception):
-    """Represents a collection of errors found during JSON parsing and validation."""
-    def __init__(self, json_data: Dict, errors: List[JSONParsingErrorDetails]):
+    """Represents a collection of errors found during JSON parsing and validation.
+
+    `file` is the schema file the errors were found in, or None for errors spanning several files.
+    """
+    def __init__(self, json_data: Dict, errors: List[JSONParsingErrorDetails], file: Optional[pathlib.Path] = None):
         self.json_data = json_data
         self.errors = errors
+        self.file = file
 
 class InvalidTypeError(Exception):
     """Raised when a field's type is not a primitive or a defined message."""
@@ -0,0 +1,7 @@
+from importlib.metadata import version, PackageNotFoundError
+
+try:
+    COMPILER_VERSION = version("beta_protoc_compiler")
+except PackageNotFoundError:
+    # Running from a source checkout without the package being installed
+    COMPILER_VERSION = "dev"
@@ -1,7 +1,8 @@
 import pathlib
+from typing import Optional
 from jinja2 import Environment, FileSystemLoader
 
-from .language import Language
+from .language import Language, to_c_string_literal
 from compiler.protoc_schema.schema import ProtocSchema
 
 class Generator:
@@ -9,22 +10,34 @@ class Generator:
 
     Attributes:
         env: The Jinja2 environment used for template rendering.
+        cache_dir: The directory of the parsed-schema cache, or None to disable caching.
+        python_extension: Whether to also generate a CPython extension module wrapping the C codecs.
     """
-    def __init__(self, template_dir: pathlib.Path, languages: list[Language]):
+    PYTHON_EXTENSION_LANG = "C"
+    PYTHON_EXTENSION_FILES = {
+        "module.c": "beta_protoc_generated.c",
+        "setup.py": "setup.py",
+    }
+
+    def __init__(self, template_dir: pathlib.Path, languages: list[Language], cache_dir: Optional[pathlib.Path] = None,
+                 python_extension: bool = False):
         self.env = Environment(loader=FileSystemLoader(template_dir))
+        self.env.filters["c_string"] = to_c_string_literal
         self.languages = languages
+        self.cache_dir = cache_dir
+        self.python_extension = python_extension
 
     def generate(self, in_file: pathlib.Path, out_dir: pathlib.Path):
         """Generates code from a JSON message definition file.
 
-        This method reads a JSON file containing message definitions, parses them, and then
-        generates source and header files for each message in each of the supported languages.
+        This method reads a JSON file containing message definitions (and the files it imports),
+        parses them, and then generates source and header files for each message in each of the supported languages.
 
         Args:
             in_file: The path to the input JSON file.
             out_dir: The path to the output directory where the generated files will be saved.
         """
-        schema = ProtocSchema.from_json_file(in_file)
+        schema = ProtocSchema.from_json_file(in_file, self.cache_dir)
         messages = schema.messages
 
         for lang in self.languages:
@@ -33,7 +46,8 @@ class Generator:
             lang_path = out_dir / lang.name / "beta_protoc_generated"
             lang_path.mkdir(parents=True, exist_ok=True)
 
-            src_path = lang_path / "src"
+            # Header-only languages keep their sources alongside the headers
+            src_path = lang_path / ("include" if lang.header_only else "src")
             src_path.mkdir(parents=True, exist_ok=True)
 
             header_template = None
@@ -66,4 +80,21 @@ class Generator:
                 build_template = self.env.get_template(f"{lang.name}/{build_filename}.j2")
                 build_content = build_template.render(messages=messages, lang=lang)
                 with open(lang_path / build_filename, "w") as f:
-                    f.write(build_content)
\ No newline at end of file
+                    f.write(build_content)
+
+            if self.python_extension and lang.name == self.PYTHON_EXTENSION_LANG:
+                self.generate_python_extension(messages, lang, lang_path / "python")
+
+    def generate_python_extension(self, messages: list, lang: Language, out_dir: pathlib.Path):
+        """Generates the sources of a CPython extension module wrapping the generated C codecs.
+
+        Args:
+            messages: The messages of the schema.
+            lang: The C language.
+            out_dir: The directory where the extension sources will be saved.
+        """
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for template_name, filename in self.PYTHON_EXTENSION_FILES.items():
+            content = self.env.get_template(f"{lang.name}/python/{template_name}.j2").render(messages=messages, lang=lang)
+            with open(out_dir / filename, "w") as f:
+                f.write(content)
\ No newline at end of file
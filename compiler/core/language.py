@@ -13,6 +13,18 @@ def camel_to_snake(string: str) -> str:
 def camel_to_camel(string: str) -> str:
     return string
 
+def to_c_string_literal(data: bytes) -> str:
+    """Converts raw bytes to a C/C++ string literal, escaping every non-printable or special byte."""
+    chars = []
+    for byte in data:
+        char = chr(byte)
+        if 0x20 <= byte < 0x7F and char not in '"\\?':
+            chars.append(char)
+        else:
+            # Octal escapes have at most 3 digits, so they never swallow the next char (unlike hex escapes)
+            chars.append(f"\\{byte:03o}")
+    return '"' + "".join(chars) + '"'
+
 class Case(Enum):
     """An enumeration of case conversion functions."""
     SNAKE = 0
@@ -29,6 +41,7 @@ class Language(BaseModel):
     case: Case
     src_ext: Annotated[str, AfterValidator(is_valid_extension)] = PydanticField(min_length=1)
     header_ext: Annotated[str, AfterValidator(is_valid_extension)] | None = None
+    header_only: bool = False
     types_mapping: Dict[DataType, str] = PydanticField(default_factory=dict)
     build_filenames: List[str] = PydanticField(default_factory=list)
 
@@ -71,5 +84,26 @@ SUPPORTED_LANGUAGES = [
             DataType.BOOL: "bool",
         },
         build_filenames=["CMakeLists.txt"]
+    ),
+    Language(
+        name="C++",
+        case=Case.SNAKE,
+        src_ext="hpp",
+        header_only=True,
+        types_mapping={
+            DataType.UINT8: "std::uint8_t",
+            DataType.UINT16: "std::uint16_t",
+            DataType.UINT32: "std::uint32_t",
+            DataType.UINT64: "std::uint64_t",
+            DataType.INT8: "std::int8_t",
+            DataType.INT16: "std::int16_t",
+            DataType.INT32: "std::int32_t",
+            DataType.INT64: "std::int64_t",
+            DataType.FLOAT32: "float",
+            DataType.FLOAT64: "double",
+            DataType.CHAR: "char",
+            DataType.BOOL: "bool",
+        },
+        build_filenames=["CMakeLists.txt"]
     )
 ]
\ No newline at end of file
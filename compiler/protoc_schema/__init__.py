@@ -1,9 +1,11 @@
 from .message import Message
 from .field import Field
 from .schema import ProtocSchema
+from .cache import SchemaCache
 
 __all__ = [
     "Message",
     "Field",
     "ProtocSchema",
+    "SchemaCache",
 ]
\ No newline at end of file
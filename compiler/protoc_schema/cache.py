@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+from typing import Dict, Optional, Type, TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from compiler.common.version import COMPILER_VERSION
+
+if TYPE_CHECKING:
+    from .schema import ProtocSchema
+
+# Packages whose sources define how schema files are parsed and validated
+VALIDATION_SOURCE_DIRS = [
+    pathlib.Path(__file__).parent,
+    pathlib.Path(__file__).parent.parent / "common",
+]
+
+def _restore_model(model_cls: Type[BaseModel], data: Dict) -> BaseModel:
+    """Rebuilds a model from its dump without validating it, the way pydantic restores pickled models."""
+    model = model_cls.__new__(model_cls)
+    model.__setstate__({
+        "__dict__": data,
+        "__pydantic_fields_set__": set(data),
+        "__pydantic_extra__": None,
+        "__pydantic_private__": None,
+    })
+    return model
+
+class SchemaCache:
+    """An on-disk cache of validated schemas.
+
+    Each entry holds the fully validated schema of a root schema file, with the messages of all the
+    files it imports (after the cross-file checks), along with the hash of each of these files.
+    Entries are keyed by the path of the root file, the compiler version and the sources of the
+    schema models and validators, so entries validated under other rules are never used. An entry
+    is only used if none of the files it was built from changed since.
+
+    Entries are stored as JSON and rebuilt without running any code from the cache directory.
+
+    Attributes:
+        cache_dir: The directory where the cache entries are stored.
+    """
+    def __init__(self, cache_dir: pathlib.Path):
+        self.cache_dir = pathlib.Path(cache_dir)
+        self._sources_fingerprint: Optional[str] = None
+
+    def _get_sources_fingerprint(self) -> str:
+        """Returns a fingerprint of the schema models and validators sources, so that cached models are invalidated when they change."""
+        if self._sources_fingerprint is None:
+            digest = hashlib.sha256()
+            for source_dir in VALIDATION_SOURCE_DIRS:
+                for source in sorted(source_dir.glob("*.py")):
+                    digest.update(f"{source_dir.name}/{source.name}".encode())
+                    digest.update(b"\0")
+                    digest.update(source.read_bytes())
+                    digest.update(b"\0")
+            self._sources_fingerprint = digest.hexdigest()
+        return self._sources_fingerprint
+
+    def get_key(self, in_file: pathlib.Path) -> str:
+        """Computes the cache key of a root schema file from its resolved path."""
+        digest = hashlib.sha256()
+        digest.update(COMPILER_VERSION.encode())
+        digest.update(b"\0")
+        digest.update(self._get_sources_fingerprint().encode())
+        digest.update(b"\0")
+        digest.update(str(in_file).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_content(content: bytes) -> str:
+        """Computes the hash of the content of a schema file, used to detect changed files."""
+        return hashlib.sha256(content).hexdigest()
+
+    def load(self, in_file: pathlib.Path) -> Optional['ProtocSchema']:
+        """Loads the cached schema of a root schema file.
+
+        Args:
+            in_file: The resolved path to the root schema file.
+
+        Returns:
+            The cached `ProtocSchema`, or None if there is no usable entry for this file.
+        """
+        from .schema import ProtocSchema
+        from .message import Message
+        from .field import Field
+
+        try:
+            with open(self.cache_dir / (self.get_key(in_file) + ".json"), "rb") as f:
+                entry = json.load(f)
+
+            for file, file_hash in entry["files"].items():
+                with open(file, "rb") as f:
+                    if self.hash_content(f.read()) != file_hash:
+                        return None
+
+            data = entry["schema"]
+            for msg in data["messages"]:
+                msg["fields"] = [_restore_model(Field, field) for field in msg["fields"]]
+            data["messages"] = [_restore_model(Message, msg) for msg in data["messages"]]
+            return _restore_model(ProtocSchema, data)
+        except Exception:
+            # A missing, corrupted or incompatible entry, or a deleted schema file, is treated as a miss
+            return None
+
+    def store(self, in_file: pathlib.Path, file_hashes: Dict[pathlib.Path, str], schema: 'ProtocSchema'):
+        """Stores the validated schema of a root schema file.
+
+        The entry is written atomically, so concurrent runs never read a partially written entry.
+        Failing to write the cache is not an error, as it only affects the next runs' performance.
+
+        Args:
+            in_file: The resolved path to the root schema file.
+            file_hashes: The hash of the content of each file the schema was built from.
+            schema: The validated schema.
+        """
+        entry = {
+            "files": {str(file): file_hash for file, file_hash in file_hashes.items()},
+            "schema": schema.model_dump(mode="json"),
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, self.cache_dir / (self.get_key(in_file) + ".json"))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
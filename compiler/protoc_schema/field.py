@@ -1,7 +1,8 @@
 from pydantic import BaseModel, Field as PydanticField, AfterValidator, model_validator
+from pydantic_core import PydanticCustomError
 from compiler.common.data_types import DataType
 from compiler.common.validators import is_valid_name
-from typing import Annotated, Optional
+from typing import Annotated, List, Optional
 from compiler.common.validators import NAME_RE_STRING
 import re
 
@@ -14,6 +15,7 @@ class Field(BaseModel):
         type: The data type of the field. Representing a string from a 'DataType' member or custom message type.
         size: The size for fixed-size types like 'string[SIZE]'.
         is_primitive: A boolean indicating whether the field's type is a primitive data type.
+        dictionary: Known values of a 'char' array field, sent as an index instead of the string when they match.
     """
     name: Annotated[str, AfterValidator(is_valid_name)] = PydanticField(min_length=1)
     id: int = PydanticField(gt=-1)
@@ -24,6 +26,7 @@ class Field(BaseModel):
     is_dynamic: Optional[bool] = False
     array_size: Optional[int] = None
 
+    dictionary: Optional[List[str]] = PydanticField(default=None, min_length=1)
 
     @model_validator(mode='after')
     def normalize_type(self):
@@ -46,6 +49,43 @@ class Field(BaseModel):
 
         return self
 
+    @model_validator(mode='after')
+    def check_dictionary(self):
+        """Checks that the dictionary, if any, belongs to a 'char' array and that its entries can be stored in it."""
+        if self.dictionary is None:
+            return self
+
+        if not (self.is_array and self.type == DataType.CHAR.value):
+            raise PydanticCustomError(
+                "invalid_dictionary",
+                "A dictionary is only allowed on 'char' array fields.",
+            )
+
+        for entry in self.dictionary:
+            if entry == "" or "\0" in entry:
+                raise PydanticCustomError(
+                    "invalid_dictionary_entry",
+                    'Dictionary entries cannot be empty nor contain null characters.',
+                )
+            if self.array_size is not None and len(entry.encode("utf-8")) > self.array_size:
+                raise PydanticCustomError(
+                    "invalid_dictionary_entry",
+                    '"{entry}" does not fit in {size} chars.',
+                    {"entry": entry, "size": self.array_size},
+                )
+
+        if len(set(self.dictionary)) != len(self.dictionary):
+            raise PydanticCustomError(
+                "invalid_dictionary_entry",
+                "Dictionary entries must be unique.",
+            )
+
+        return self
+
+    def get_dictionary_entries(self) -> List[tuple[bytes, int]]:
+        """Returns the UTF-8 encoded dictionary entries of the field along with their length, in index order."""
+        return [(entry.encode("utf-8"), len(entry.encode("utf-8"))) for entry in self.dictionary or []]
+
     def get_count_var_name(self):
         """Generates a variable name for the count of elements in an array field."""
         return f"{self.name}_count"
@@ -1,7 +1,8 @@
-from pydantic import ValidationError, BaseModel
+from pydantic import ValidationError, BaseModel, Field as PydanticField
 from pydantic_core import ErrorDetails
-from typing import List, Dict
+from typing import List, Dict, Optional
 from .message import Message
+from .cache import SchemaCache
 from compiler.common.errors import JSONParsingErrors, JSONParsingErrorDetails
 import pathlib
 import json
@@ -12,11 +13,17 @@ VALIDATION_MESSAGES = {
 }
 
 class ProtocSchema(BaseModel):
-    """Represents a protoc_schema definition."""
+    """Represents a protoc_schema definition.
+
+    Attributes:
+        imports: Paths of other schema files whose messages are part of this schema, relative to this file.
+        messages: A list of `Message` objects defined in this schema.
+    """
+    imports: List[str] = PydanticField(default_factory=list)
     messages: List[Message]
 
     @staticmethod
-    def handle_validation_error(e: ValidationError, json_data: Dict):
+    def handle_validation_error(e: ValidationError, json_data: Dict, in_file: Optional[pathlib.Path] = None):
         """Handles Pydantic validation errors and transforms them into custom `JSONParsingErrors`.
 
         This method processes a `ValidationError` from Pydantic, applies custom error messages
@@ -25,6 +32,7 @@ class ProtocSchema(BaseModel):
         Args:
             e: The `ValidationError` instance caught during Pydantic model validation.
             json_data: The original JSON data that was being validated.
+            in_file: The path to the schema file the JSON data comes from, if any.
 
         Raises:
             JSONParsingErrors: Always raises this exception with the processed error details.
@@ -39,17 +47,20 @@ class ProtocSchema(BaseModel):
                 )
             new_errors.append(error)
 
-        raise JSONParsingErrors(json_data, [JSONParsingErrorDetails(err.get("msg"), err.get("loc")) for err in new_errors])
+        raise JSONParsingErrors(json_data, [JSONParsingErrorDetails(err.get("msg"), err.get("loc")) for err in new_errors], in_file)
 
     @classmethod
-    def from_json_file(cls, in_file: pathlib.Path) -> 'ProtocSchema':
-        """Parses and validates a JSON file into a `ProtocSchema` object.
+    def from_json_file(cls, in_file: pathlib.Path, cache_dir: Optional[pathlib.Path] = None) -> 'ProtocSchema':
+        """Parses and validates a JSON file, along with the files it imports, into a `ProtocSchema` object.
 
-        This method reads the specified JSON file, validates its structure against
-        the `ProtocSchema` model, and then performs additional validation checks.
+        Each file is validated on its own, then the messages of all the files are merged into a
+        single schema, on which the cross-file validation checks are performed. When a cache
+        directory is given, the resulting schema is cached, so that as long as none of the files
+        changes, the schema is restored instead of being validated again.
 
         Args:
             in_file: The path to the input JSON file.
+            cache_dir: The directory of the parsed-schema cache, or None to disable caching.
 
         Returns:
             A validated `ProtocSchema` object.
@@ -57,16 +68,56 @@ class ProtocSchema(BaseModel):
         Raises:
             JSONParsingErrors: If any validation errors occur during parsing.
         """
-        with open(in_file, "r") as f:
-            data = json.load(f)
+        in_file = pathlib.Path(in_file).resolve()
+        cache = SchemaCache(cache_dir) if cache_dir is not None else None
+        if cache is not None:
+            schema = cache.load(in_file)
+            if schema is not None:
+                return schema
+
+        loaded: Dict[pathlib.Path, 'ProtocSchema'] = {}
+        file_hashes: Dict[pathlib.Path, str] = {}
+        cls._load_file_tree(in_file, loaded, file_hashes)
+
+        schema = cls.model_construct(messages=[msg for file_schema in loaded.values() for msg in file_schema.messages])
+        schema.validate_schema()
+
+        if cache is not None:
+            cache.store(in_file, file_hashes, schema)
+        return schema
+
+    @classmethod
+    def _load_file_tree(cls, in_file: pathlib.Path, loaded: Dict[pathlib.Path, 'ProtocSchema'], file_hashes: Dict[pathlib.Path, str]):
+        """Loads a schema file and, recursively, the files it imports.
 
+        Each file is loaded only once, even if it is imported several times (or cyclically).
+
+        Args:
+            in_file: The resolved path to the schema file.
+            loaded: The files loaded so far, in loading order. It is updated in place.
+            file_hashes: The hash of the content of the files loaded so far. It is updated in place.
+        """
+        with open(in_file, "rb") as f:
+            content = f.read()
+        file_hashes[in_file] = SchemaCache.hash_content(content)
+
+        data = json.loads(content)
         try:
             schema = cls.model_validate(data)
-            schema.validate_schema()
-            return schema
-
         except ValidationError as e:
-            raise cls.handle_validation_error(e, data)
+            raise cls.handle_validation_error(e, data, in_file)
+
+        loaded[in_file] = schema
+
+        for import_index, import_path in enumerate(schema.imports):
+            imported_file = (in_file.parent / import_path).resolve()
+            if not imported_file.is_file():
+                raise JSONParsingErrors(data, [JSONParsingErrorDetails(
+                    message=f"Imported file \"{import_path}\" does not exist.",
+                    loc=("imports", import_index)
+                )], in_file)
+            if imported_file not in loaded:
+                cls._load_file_tree(imported_file, loaded, file_hashes)
 
     def validate_schema(self):
         """Validates the entire protoc_schema after initial parsing.
@@ -0,0 +1,307 @@
+#ifndef VALUE_MSG_HPP
+#define VALUE_MSG_HPP
+
+#include <array>
+#include <cstddef>
+#include <cstdint>
+
+#include "beta_protoc.hpp"
+
+// Include dependencies for nested messages
+
+namespace beta_protoc_generated {
+
+// Message-specific struct definition
+struct Value {
+    static constexpr std::uint16_t ID = 1;
+
+    // Whether the message, or one of its nested messages, contains dynamic arrays
+    static constexpr bool HAS_DYNAMIC_ARRAYS = false;
+
+    // Compile-time field metadata (id, name, type, is_primitive, is_array, is_dynamic, array_size)
+    static constexpr std::array<beta_protoc::FieldDescriptor, 2> FIELDS = {
+        beta_protoc::FieldDescriptor{ 0, "value", "uint32", true, false, false, 0 },
+        beta_protoc::FieldDescriptor{ 1, "unit", "char", true, true, false, 32 },
+    };
+
+    // Dictionary of the unit field, its entries are sent as their index
+    static constexpr std::array<beta_protoc::DictionaryEntry, 5> UNIT_DICTIONARY = {
+        beta_protoc::DictionaryEntry{ "celsius", 7 },
+        beta_protoc::DictionaryEntry{ "fahrenheit", 10 },
+        beta_protoc::DictionaryEntry{ "percent", 7 },
+        beta_protoc::DictionaryEntry{ "pascal", 6 },
+        beta_protoc::DictionaryEntry{ "lux", 3 },
+    };
+
+    // Field: value (ID: 0)
+    std::uint32_t value{};
+    // Field: unit (ID: 1)
+    std::array<char, 32> unit{};
+    std::size_t unit_count{}; // Number of elements in the array
+
+    /**
+     * @brief Calculates the serialized size of the Value message payload.
+     *
+     * @param size Set to the size in bytes on success.
+     * @return Error::Success on success, error code otherwise.
+     */
+    [[nodiscard]] inline beta_protoc::Error get_size(std::size_t &size) const noexcept;
+
+    /**
+     * @brief Serializes the Value message payload.
+     *
+     * @param writer Writer over the output buffer, advanced by the number of bytes written.
+     * @return Error::Success on success, error code otherwise.
+     */
+    [[nodiscard]] inline beta_protoc::Error to_buff(beta_protoc::Writer &writer) const noexcept;
+
+    /**
+     * @brief Serializes the Value message into a complete binary message (header + payload).
+     *
+     * @param writer Writer over the output buffer, advanced by the number of bytes written.
+     * @return Error::Success on success, error code otherwise.
+     */
+    [[nodiscard]] inline beta_protoc::Error to_message(beta_protoc::Writer &writer) const noexcept;
+
+    /**
+     * @brief Deserializes the payload of a Value message.
+     *
+     * Dynamic array views must be set to caller-owned storage before calling this function.
+     *
+     * @param reader Reader over the payload, which is consumed entirely on success.
+     * @return Error::Success on success, error code otherwise.
+     */
+    [[nodiscard]] inline beta_protoc::Error from_buff(beta_protoc::Reader &reader) noexcept;
+
+    /**
+     * @brief Deserializes a complete binary message (header + payload) into this Value.
+     *
+     * @param reader Reader over the input buffer, advanced by the number of bytes read.
+     * @return Error::Success on success, error code otherwise.
+     */
+    [[nodiscard]] inline beta_protoc::Error from_message(beta_protoc::Reader &reader) noexcept;
+};
+
+inline beta_protoc::Error Value::get_size(std::size_t &size) const noexcept {
+    beta_protoc::Error err = beta_protoc::Error::Success;
+    (void) err;
+
+    size = 0;
+    // Field: value
+    {
+        std::size_t field_size = beta_protoc::uint32_size(this->value);
+        size += beta_protoc::varint_size(0) + beta_protoc::varint_size(field_size) + field_size;
+    }
+    // Field: unit
+    {
+        if (this->unit_count > this->unit.size()) {
+            return beta_protoc::Error::ArraySizeExceeded;
+        }
+        std::size_t count = 0;
+        while (count < this->unit_count && this->unit[count] != '\0') {
+            count++;
+        }
+        // Dictionary index or literal string size calculation
+        std::size_t field_size = beta_protoc::dict_string_size(UNIT_DICTIONARY, this->unit.data(), count);
+        size += beta_protoc::varint_size(1) + beta_protoc::varint_size(field_size) + field_size;
+    }
+    return beta_protoc::Error::Success;
+}
+
+inline beta_protoc::Error Value::to_buff(beta_protoc::Writer &writer) const noexcept {
+    beta_protoc::Error err = beta_protoc::Error::Success;
+    (void) err;
+    (void) writer;
+    // Field: value
+    {
+        // Serialize field ID and length
+        err = beta_protoc::varint_to_buff(0, writer);
+        if (err != beta_protoc::Error::Success) {
+            return err;
+        }
+        err = beta_protoc::varint_to_buff(beta_protoc::uint32_size(this->value), writer);
+        if (err != beta_protoc::Error::Success) {
+            return err;
+        }
+
+        // Serialize value
+        err = beta_protoc::uint32_to_buff(this->value, writer);
+        if (err != beta_protoc::Error::Success) {
+            return err;
+        }
+    }
+    // Field: unit
+    {
+        if (this->unit_count > this->unit.size()) {
+            return beta_protoc::Error::ArraySizeExceeded;
+        }
+        std::size_t count = this->unit_count;
+        // Special case for char type to avoid writing after null-terminator
+        for (std::size_t i = 0; i < count; i++) {
+            if (this->unit[i] == '\0') {
+                count = i;
+                break;
+            }
+        }
+        std::size_t array_size = beta_protoc::dict_string_size(UNIT_DICTIONARY, this->unit.data(), count);
+
+        // Serialize field ID and length (sum of all elements size for primitive arrays)
+        err = beta_protoc::varint_to_buff(1, writer);
+        if (err != beta_protoc::Error::Success) {
+            return err;
+        }
+        err = beta_protoc::varint_to_buff(array_size, writer);
+        if (err != beta_protoc::Error::Success) {
+            return err;
+        }
+
+        // Serialize values
+        // Dictionary index on a hit, literal string on a miss
+        err = beta_protoc::dict_string_to_buff(UNIT_DICTIONARY, this->unit.data(), count, writer);
+        if (err != beta_protoc::Error::Success) {
+            return err;
+        }
+    }
+    return beta_protoc::Error::Success;
+}
+
+inline beta_protoc::Error Value::to_message(beta_protoc::Writer &writer) const noexcept {
+    // Write protocol version
+    beta_protoc::Error err = writer.put(beta_protoc::PROTOCOL_VERSION);
+    if (err != beta_protoc::Error::Success) {
+        return err;
+    }
+
+    // Write message ID (little-endian)
+    err = beta_protoc::uint16_to_buff(ID, writer);
+    if (err != beta_protoc::Error::Success) {
+        return err;
+    }
+
+    // Write payload size
+    std::size_t payload_size = 0;
+    err = this->get_size(payload_size);
+    if (err != beta_protoc::Error::Success) {
+        return err;
+    }
+    err = beta_protoc::varint_to_buff(payload_size, writer);
+    if (err != beta_protoc::Error::Success) {
+        return err;
+    }
+
+    // Write payload
+    return this->to_buff(writer);
+}
+
+inline beta_protoc::Error Value::from_buff(beta_protoc::Reader &reader) noexcept {
+    beta_protoc::Error err = beta_protoc::Error::Success;
+
+    // Initialize array counts
+    this->unit_count = 0;
+
+    while (reader.remaining() > 0) {
+        // Deserialize field ID
+        std::uint64_t field_id = 0;
+        err = beta_protoc::varint_from_buff(field_id, reader);
+        if (err != beta_protoc::Error::Success) {
+            return err;
+        }
+
+        // Deserialize field length
+        std::size_t field_len = 0;
+        err = beta_protoc::length_from_buff(field_len, reader);
+        if (err != beta_protoc::Error::Success) {
+            return err;
+        }
+        if (field_len > reader.remaining()) {
+            return beta_protoc::Error::InvalidData;
+        }
+        beta_protoc::Reader field_reader = reader.sub(field_len);
+        (void) reader.skip(field_len);
+
+        switch (field_id) {
+            // Field: value
+            case 0: {
+                // Deserialize field value
+                err = beta_protoc::uint32_from_buff(this->value, field_reader);
+                if (err != beta_protoc::Error::Success) {
+                    return err;
+                }
+
+                // Check if the correct number of bytes were read
+                if (field_reader.remaining() != 0) {
+                    return beta_protoc::Error::InvalidData;
+                }
+                break;
+            }
+            // Field: unit
+            case 1: {
+                // Deserialize field value
+                err = beta_protoc::dict_string_from_buff(UNIT_DICTIONARY, this->unit, this->unit_count, field_reader);
+                if (err != beta_protoc::Error::Success) {
+                    return err;
+                }
+
+                // Check if the correct number of bytes were read
+                if (field_reader.remaining() != 0) {
+                    return beta_protoc::Error::InvalidData;
+                }
+                break;
+            }
+            default:
+                // Skip unknown fields
+                (void) field_reader;
+                break;
+        }
+    }
+
+    // Null-terminate strings
+    if (this->unit_count < this->unit.size()) {
+        this->unit[this->unit_count] = '\0';
+    }
+
+    return beta_protoc::Error::Success;
+}
+
+inline beta_protoc::Error Value::from_message(beta_protoc::Reader &reader) noexcept {
+    // Read and check protocol version
+    std::uint8_t version = 0;
+    if (reader.get(version) != beta_protoc::Error::Success) {
+        return beta_protoc::Error::InvalidData;
+    }
+    if (version != beta_protoc::PROTOCOL_VERSION) {
+        return beta_protoc::Error::InvalidProtocVersion;
+    }
+
+    // Read and check message ID (little-endian)
+    std::uint16_t id = 0;
+    if (beta_protoc::uint16_from_buff(id, reader) != beta_protoc::Error::Success) {
+        return beta_protoc::Error::InvalidData;
+    }
+    if (id != ID) {
+        return beta_protoc::Error::InvalidId;
+    }
+
+    // Read payload length
+    std::size_t payload_len = 0;
+    beta_protoc::Error err = beta_protoc::length_from_buff(payload_len, reader);
+    if (err != beta_protoc::Error::Success) {
+        return err;
+    }
+    if (reader.remaining() < payload_len) {
+        return beta_protoc::Error::InvalidData;
+    }
+
+    // Read payload
+    beta_protoc::Reader payload = reader.sub(payload_len);
+    err = this->from_buff(payload);
+    if (err != beta_protoc::Error::Success) {
+        return err;
+    }
+
+    return reader.skip(payload_len);
+}
+
+} // namespace beta_protoc_generated
+
+#endif // VALUE_MSG_HPP
\ No newline at end of file
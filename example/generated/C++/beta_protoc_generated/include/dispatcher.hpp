@@ -0,0 +1,131 @@
+#ifndef DISPATCHER_HPP
+#define DISPATCHER_HPP
+
+#include <cstdint>
+#include <type_traits>
+
+#include "beta_protoc.hpp"
+
+// Include all message headers
+#include "SensorData.hpp"
+#include "Value.hpp"
+
+namespace beta_protoc_generated {
+
+// Error codes for the dispatcher, numerically identical to the C dispatcher's dispatcher_err_t
+enum class DispatcherError : int {
+    Success = 0,
+    InvalidData = -100,
+    InvalidProtocVersion = -101,
+    UnknownMessageId = -102,
+};
+
+/**
+ * @brief Skips a complete binary message (header + payload) without decoding its payload.
+ *
+ * @param reader Reader over the buffer, advanced past the message on success.
+ * @return Error::Success on success, error code otherwise.
+ */
+[[nodiscard]] inline beta_protoc::Error skip_message(beta_protoc::Reader &reader) noexcept {
+    beta_protoc::Error err = reader.skip(3);
+    if (err != beta_protoc::Error::Success) {
+        return err;
+    }
+    std::size_t payload_len = 0;
+    err = beta_protoc::length_from_buff(payload_len, reader);
+    if (err != beta_protoc::Error::Success) {
+        return err;
+    }
+    return reader.skip(payload_len);
+}
+
+// Default storage of protoc_dispatch, for messages without dynamic arrays
+struct NoStorage {};
+
+/**
+ * @brief Dispatches an incoming binary message.
+ *
+ * It reads the message header, finds the corresponding message type and, if `handler` can be
+ * called with it, deserializes the message and calls `handler(msg)`. Whether a message type is
+ * handled is resolved at compile time: messages the handler does not accept are skipped
+ * without being decoded.
+ *
+ * @param reader Reader over the buffer containing the binary message.
+ *               It is advanced past the processed message.
+ * @param handler Callable (e.g. a set of overloaded lambdas) taking `<MessageName> &` for every
+ *                message type to handle.
+ * @param storage Callable taking `<MessageName> &`, called before decoding a handled message to point
+ *                its dynamic arrays (including the nested ones) to caller-owned storage. It is required
+ *                for the handled messages containing dynamic arrays.
+ * @return 0 on success, a DispatcherError or beta_protoc::Error value otherwise.
+ */
+template <typename Handler, typename Storage = NoStorage>
+inline int protoc_dispatch(beta_protoc::Reader &reader, Handler &&handler, Storage &&storage = Storage{}) {
+    const std::uint8_t *p_buff = reader.position();
+
+    // Check for minimum buffer size (version + message ID)
+    if (reader.remaining() < 3) {
+        return static_cast<int>(DispatcherError::InvalidData);
+    }
+    // Check protocol version
+    if (p_buff[0] != beta_protoc::PROTOCOL_VERSION) {
+        return static_cast<int>(DispatcherError::InvalidProtocVersion);
+    }
+
+    beta_protoc::Error result = beta_protoc::Error::Success;
+
+    // Dispatch based on message ID (little-endian)
+    switch ((static_cast<std::uint16_t>(p_buff[2]) << 8) | static_cast<std::uint16_t>(p_buff[1])) {
+        case 0: {
+            if constexpr (std::is_invocable_v<Handler &, SensorData &>) {
+                SensorData msg{};
+                static_assert(!SensorData::HAS_DYNAMIC_ARRAYS || std::is_invocable_v<Storage &, SensorData &>,
+                              "SensorData contains dynamic arrays, a storage callable must provide them");
+                if constexpr (std::is_invocable_v<Storage &, SensorData &>) {
+                    storage(msg);
+                }
+                result = msg.from_message(reader);
+                if (result != beta_protoc::Error::Success) {
+                    return static_cast<int>(result);
+                }
+                handler(msg);
+            } else {
+                result = skip_message(reader);
+                if (result != beta_protoc::Error::Success) {
+                    return static_cast<int>(result);
+                }
+            }
+            return static_cast<int>(DispatcherError::Success);
+        }
+        case 1: {
+            if constexpr (std::is_invocable_v<Handler &, Value &>) {
+                Value msg{};
+                static_assert(!Value::HAS_DYNAMIC_ARRAYS || std::is_invocable_v<Storage &, Value &>,
+                              "Value contains dynamic arrays, a storage callable must provide them");
+                if constexpr (std::is_invocable_v<Storage &, Value &>) {
+                    storage(msg);
+                }
+                result = msg.from_message(reader);
+                if (result != beta_protoc::Error::Success) {
+                    return static_cast<int>(result);
+                }
+                handler(msg);
+            } else {
+                result = skip_message(reader);
+                if (result != beta_protoc::Error::Success) {
+                    return static_cast<int>(result);
+                }
+            }
+            return static_cast<int>(DispatcherError::Success);
+        }
+        default:
+            (void) result;
+            (void) handler;
+            (void) storage;
+            return static_cast<int>(DispatcherError::UnknownMessageId);
+    }
+}
+
+} // namespace beta_protoc_generated
+
+#endif // DISPATCHER_HPP
\ No newline at end of file
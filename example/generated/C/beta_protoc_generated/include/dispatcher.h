@@ -20,33 +20,75 @@ typedef enum {
     DISPATCHER_ERR_UNKNOWN_MESSAGE_ID = -102,
 } dispatcher_err_t;
 
+// Number of message types, the dispatch tables hold one slot per message type
+#define PROTOC_MESSAGE_COUNT 2
+
+// Generic handler type stored in the handler table
+typedef void (*protoc_handler_t)(void);
+
 // Weak callback function declarations to be implemented by the user
 /**
  * @brief Weak callback function to be implemented by the user.
  *
- * This function is called by the dispatcher when a SensorData message is
- * successfully received and deserialized.
+ * This function is the initial handler of SensorData messages: it is called by the dispatcher
+ * when a SensorData message is successfully received and deserialized, unless another
+ * handler has been registered with `protoc_register_sensor_data_handler`.
  *
  * @param msg Pointer to the deserialized SensorData message struct.
  * @param ctx Pointer to user-defined context (if needed).
  */
 void on_sensor_data_received(SensorData *msg, void *ctx) __attribute__((weak));
+
+typedef void (*sensor_data_handler_t)(SensorData *msg, void *ctx);
+
+/**
+ * @brief Registers the handler called when a SensorData message is received.
+ *
+ * @param handler The handler to call, replacing the current one. NULL unregisters the current handler.
+ */
+void protoc_register_sensor_data_handler(sensor_data_handler_t handler);
+
+/**
+ * @brief Unregisters the handler of SensorData messages.
+ *
+ * The dispatcher then skips SensorData messages without deserializing them.
+ */
+void protoc_unregister_sensor_data_handler(void);
+
 /**
  * @brief Weak callback function to be implemented by the user.
  *
- * This function is called by the dispatcher when a Value message is
- * successfully received and deserialized.
+ * This function is the initial handler of Value messages: it is called by the dispatcher
+ * when a Value message is successfully received and deserialized, unless another
+ * handler has been registered with `protoc_register_value_handler`.
  *
  * @param msg Pointer to the deserialized Value message struct.
  * @param ctx Pointer to user-defined context (if needed).
  */
 void on_value_received(Value *msg, void *ctx) __attribute__((weak));
 
+typedef void (*value_handler_t)(Value *msg, void *ctx);
+
+/**
+ * @brief Registers the handler called when a Value message is received.
+ *
+ * @param handler The handler to call, replacing the current one. NULL unregisters the current handler.
+ */
+void protoc_register_value_handler(value_handler_t handler);
+
+/**
+ * @brief Unregisters the handler of Value messages.
+ *
+ * The dispatcher then skips Value messages without deserializing them.
+ */
+void protoc_unregister_value_handler(void);
+
 /**
  * @brief Dispatches an incoming binary message.
  *
- * It reads the message header, finds the corresponding message type,
- * deserializes it, and calls the appropriate `on_<MessageName>_received` callback if it exists.
+ * It reads the message header and looks the slot of the message ID up. If a handler
+ * is registered for this message type, the message is deserialized and the handler is called,
+ * otherwise the message is skipped without being deserialized.
  *
  * @param buff Double pointer to the buffer containing the binary message.
  *             The pointer is advanced past the processed message.
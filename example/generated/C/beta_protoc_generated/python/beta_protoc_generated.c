@@ -0,0 +1,792 @@
+// CPython extension module wrapping the generated C codecs (limited C API)
+#ifndef Py_LIMITED_API
+#define Py_LIMITED_API 0x030B0000
+#endif
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+#include "beta_protoc.h"
+#include "SensorData.h"
+#include "Value.h"
+
+// --- Allocation pool for dynamic arrays, freed at once after each message ---
+
+typedef union pool_block {
+    union pool_block *next;
+    max_align_t align;
+} pool_block_t;
+
+typedef struct {
+    pool_block_t *head;
+} pool_t;
+
+static inline void *pool_alloc(pool_t *pool, size_t count, size_t elem_size) {
+    if (elem_size != 0 && count > (PY_SSIZE_T_MAX - sizeof(pool_block_t)) / elem_size) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    pool_block_t *block = PyMem_Malloc(sizeof(pool_block_t) + count * elem_size);
+    if (block == NULL) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    block->next = pool->head;
+    pool->head = block;
+    return block + 1;
+}
+
+static void pool_free(pool_t *pool) {
+    while (pool->head != NULL) {
+        pool_block_t *next = pool->head->next;
+        PyMem_Free(pool->head);
+        pool->head = next;
+    }
+}
+
+// --- Payload walking ---
+
+// Reads the next field of a payload, returns 0 at the end of the payload or on invalid data
+static inline int next_field(uint8_t **p_buff, size_t *rem, uint64_t *field_id, uint8_t **value, size_t *value_len) {
+    uint64_t len;
+    if (*rem == 0 || varint_from_buff(field_id, p_buff, rem) != 0 || varint_from_buff(&len, p_buff, rem) != 0 || len > *rem) {
+        return 0;
+    }
+    *value = *p_buff;
+    *value_len = (size_t) len;
+    *p_buff += len;
+    *rem -= (size_t) len;
+    return 1;
+}
+
+// --- Growable output buffer ---
+
+typedef struct {
+    uint8_t *data;
+    size_t len;
+    size_t cap;
+} out_buffer_t;
+
+// Returns a pointer to `size` writable bytes at the end of the buffer
+static uint8_t *out_buffer_reserve(out_buffer_t *out, size_t size) {
+    if (out->cap - out->len < size) {
+        size_t new_cap = out->cap * 2 > out->len + size ? out->cap * 2 : out->len + size;
+        uint8_t *new_data = PyMem_Realloc(out->data, new_cap);
+        if (new_data == NULL) {
+            PyErr_NoMemory();
+            return NULL;
+        }
+        out->data = new_data;
+        out->cap = new_cap;
+    }
+    return out->data + out->len;
+}
+
+// --- Module state ---
+
+typedef struct {
+    PyObject *error;
+    PyTypeObject *sensor_data_type;
+    PyTypeObject *value_type;
+} module_state;
+
+static void set_protoc_error(module_state *state, int err) {
+    const char *message;
+    switch (err) {
+        case BETA_PROTOC_ERR_INVALID_ARGS: message = "invalid arguments"; break;
+        case BETA_PROTOC_ERR_BUFFER_TOO_SMALL: message = "buffer too small"; break;
+        case BETA_PROTOC_ERR_INVALID_ID: message = "invalid message ID"; break;
+        case BETA_PROTOC_ERR_INVALID_PROTOC_VERSION: message = "invalid protocol version"; break;
+        case BETA_PROTOC_VALUE_EXCEEDS_ARCH_LIMIT: message = "value exceeds architecture limits"; break;
+        case BETA_PROTOC_ERR_INVALID_DATA: message = "invalid data"; break;
+        case BETA_PROTOC_ERR_ARRAY_SIZE_EXCEEDED: message = "array size exceeded"; break;
+        case BETA_PROTOC_ERR_NULL_ARRAY_POINTER: message = "null array pointer"; break;
+        default: message = "unknown error"; break;
+    }
+    PyObject *args = Py_BuildValue("(is)", err, message);
+    if (args != NULL) {
+        PyErr_SetObject(state->error, args);
+        Py_DECREF(args);
+    }
+}
+
+// --- Primitive conversions ---
+
+static inline int py_as_unsigned(PyObject *obj, unsigned long long max, unsigned long long *out) {
+    unsigned long long value = PyLong_AsUnsignedLongLong(obj);
+    if (value == (unsigned long long) -1 && PyErr_Occurred()) {
+        return -1;
+    }
+    if (value > max) {
+        PyErr_SetString(PyExc_OverflowError, "value out of range");
+        return -1;
+    }
+    *out = value;
+    return 0;
+}
+
+static inline int py_as_signed(PyObject *obj, long long min, long long max, long long *out) {
+    long long value = PyLong_AsLongLong(obj);
+    if (value == -1 && PyErr_Occurred()) {
+        return -1;
+    }
+    if (value < min || value > max) {
+        PyErr_SetString(PyExc_OverflowError, "value out of range");
+        return -1;
+    }
+    *out = value;
+    return 0;
+}
+
+#define DEFINE_UNSIGNED_CONVERSIONS(name, type, max) \
+    static inline int py_as_##name(PyObject *obj, type *out) { \
+        unsigned long long value; \
+        if (py_as_unsigned(obj, (max), &value) != 0) return -1; \
+        *out = (type) value; \
+        return 0; \
+    } \
+    static inline PyObject *py_from_##name(type value) { \
+        return PyLong_FromUnsignedLongLong(value); \
+    }
+
+#define DEFINE_SIGNED_CONVERSIONS(name, type, min, max) \
+    static inline int py_as_##name(PyObject *obj, type *out) { \
+        long long value; \
+        if (py_as_signed(obj, (min), (max), &value) != 0) return -1; \
+        *out = (type) value; \
+        return 0; \
+    } \
+    static inline PyObject *py_from_##name(type value) { \
+        return PyLong_FromLongLong(value); \
+    }
+
+DEFINE_UNSIGNED_CONVERSIONS(uint8, uint8_t, UINT8_MAX)
+DEFINE_UNSIGNED_CONVERSIONS(uint16, uint16_t, UINT16_MAX)
+DEFINE_UNSIGNED_CONVERSIONS(uint32, uint32_t, UINT32_MAX)
+DEFINE_UNSIGNED_CONVERSIONS(uint64, uint64_t, UINT64_MAX)
+DEFINE_SIGNED_CONVERSIONS(int8, int8_t, INT8_MIN, INT8_MAX)
+DEFINE_SIGNED_CONVERSIONS(int16, int16_t, INT16_MIN, INT16_MAX)
+DEFINE_SIGNED_CONVERSIONS(int32, int32_t, INT32_MIN, INT32_MAX)
+DEFINE_SIGNED_CONVERSIONS(int64, int64_t, INT64_MIN, INT64_MAX)
+
+static inline int py_as_float64(PyObject *obj, double *out) {
+    double value = PyFloat_AsDouble(obj);
+    if (value == -1.0 && PyErr_Occurred()) {
+        return -1;
+    }
+    *out = value;
+    return 0;
+}
+
+static inline PyObject *py_from_float64(double value) {
+    return PyFloat_FromDouble(value);
+}
+
+static inline int py_as_float32(PyObject *obj, float *out) {
+    double value;
+    if (py_as_float64(obj, &value) != 0) {
+        return -1;
+    }
+    *out = (float) value;
+    return 0;
+}
+
+static inline PyObject *py_from_float32(float value) {
+    return PyFloat_FromDouble(value);
+}
+
+static inline int py_as_bool(PyObject *obj, bool *out) {
+    int value = PyObject_IsTrue(obj);
+    if (value < 0) {
+        return -1;
+    }
+    *out = value != 0;
+    return 0;
+}
+
+static inline PyObject *py_from_bool(bool value) {
+    return PyBool_FromLong(value);
+}
+
+// Strings are converted to bytes with UTF-8, undecodable bytes round-trip through surrogate escapes
+static inline PyObject *py_encode_str(PyObject *obj) {
+    if (!PyUnicode_Check(obj)) {
+        PyErr_SetString(PyExc_TypeError, "expected a str");
+        return NULL;
+    }
+    return PyUnicode_AsEncodedString(obj, "utf-8", "surrogateescape");
+}
+
+static inline PyObject *py_decode_str(const char *data, size_t len) {
+    return PyUnicode_DecodeUTF8(data, (Py_ssize_t) len, "surrogateescape");
+}
+
+static inline int py_as_char(PyObject *obj, char *out) {
+    PyObject *encoded = py_encode_str(obj);
+    if (encoded == NULL) {
+        return -1;
+    }
+    if (PyBytes_Size(encoded) != 1) {
+        Py_DECREF(encoded);
+        PyErr_SetString(PyExc_ValueError, "expected a single byte character");
+        return -1;
+    }
+    *out = PyBytes_AsString(encoded)[0];
+    Py_DECREF(encoded);
+    return 0;
+}
+
+static inline PyObject *py_from_char(char value) {
+    return py_decode_str(&value, 1);
+}
+
+// --- Message conversions ---
+
+static int py_as_sensor_data(module_state *state, PyObject *obj, SensorData *data, pool_t *pool);
+static PyObject *py_from_sensor_data(module_state *state, const SensorData *data);
+static int prepare_sensor_data(SensorData *data, pool_t *pool, uint8_t *payload, size_t payload_len);
+static int py_as_value(module_state *state, PyObject *obj, Value *data, pool_t *pool);
+static PyObject *py_from_value(module_state *state, const Value *data);
+static int prepare_value(Value *data, pool_t *pool, uint8_t *payload, size_t payload_len);
+
+static PyStructSequence_Field sensor_data_fields[] = {
+    {"id", "uint32 (ID: 0)"},
+    {"name", "char[32] (ID: 1)"},
+    {"value", "Value (ID: 2)"},
+    {NULL, NULL}
+};
+
+static PyStructSequence_Desc sensor_data_desc = {
+    "beta_protoc_generated.SensorData",
+    "SensorData message (ID: 0).",
+    sensor_data_fields,
+    3
+};
+
+static int py_as_sensor_data(module_state *state, PyObject *obj, SensorData *data, pool_t *pool) {
+    if (!PyObject_TypeCheck(obj, state->sensor_data_type)) {
+        PyErr_SetString(PyExc_TypeError, "expected a SensorData message");
+        return -1;
+    }
+    (void) data;
+    (void) pool;
+    // Field: id
+    {
+        PyObject *item = PyStructSequence_GetItem(obj, 0);
+        if (py_as_uint32(item, &data->id) != 0) {
+            return -1;
+        }
+    }
+    // Field: name
+    {
+        PyObject *item = PyStructSequence_GetItem(obj, 1);
+        PyObject *encoded = py_encode_str(item);
+        if (encoded == NULL) {
+            return -1;
+        }
+        size_t len = (size_t) PyBytes_Size(encoded);
+        if (len > 32) {
+            Py_DECREF(encoded);
+            PyErr_SetString(PyExc_ValueError, "SensorData.name is longer than 32 bytes");
+            return -1;
+        }
+        memcpy(data->name, PyBytes_AsString(encoded), len);
+        data->name_count = len;
+        Py_DECREF(encoded);
+    }
+    // Field: value
+    {
+        PyObject *item = PyStructSequence_GetItem(obj, 2);
+        if (py_as_value(state, item, &data->value, pool) != 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static PyObject *py_from_sensor_data(module_state *state, const SensorData *data) {
+    PyObject *obj = PyStructSequence_New(state->sensor_data_type);
+    if (obj == NULL) {
+        return NULL;
+    }
+    (void) data;
+    // Field: id
+    {
+        PyObject *value = py_from_uint32(data->id);
+        if (value == NULL) {
+            Py_DECREF(obj);
+            return NULL;
+        }
+        PyStructSequence_SetItem(obj, 0, value);
+    }
+    // Field: name
+    {
+        PyObject *value = py_decode_str(data->name, data->name_count);
+        if (value == NULL) {
+            Py_DECREF(obj);
+            return NULL;
+        }
+        PyStructSequence_SetItem(obj, 1, value);
+    }
+    // Field: value
+    {
+        PyObject *value = py_from_value(state, &(data->value));
+        if (value == NULL) {
+            Py_DECREF(obj);
+            return NULL;
+        }
+        PyStructSequence_SetItem(obj, 2, value);
+    }
+    return obj;
+}
+
+// Provides the dynamic arrays with storage for the elements of the payload before deserialization.
+// Each array only gets room for the elements its fields can hold, so that the storage stays linear in the payload size.
+static int prepare_sensor_data(SensorData *data, pool_t *pool, uint8_t *payload, size_t payload_len) {
+    (void) data;
+    (void) pool;
+    (void) payload;
+    (void) payload_len;
+    uint8_t *p_buff;
+    size_t rem;
+    uint64_t field_id;
+    uint8_t *value;
+    size_t value_len;
+
+    // Prepare each nested message from its own fields
+    p_buff = payload;
+    rem = payload_len;
+    while (next_field(&p_buff, &rem, &field_id, &value, &value_len)) {
+        switch (field_id) {
+            case 2:
+                if (prepare_value(&data->value, pool, value, value_len) != 0) {
+                    return -1;
+                }
+                break;
+            default:
+                break;
+        }
+    }
+    return 0;
+}
+
+static int encode_sensor_data(module_state *state, PyObject *obj, out_buffer_t *out) {
+    pool_t pool = {NULL};
+    SensorData data;
+    memset(&data, 0, sizeof(data));
+    int ret = -1;
+
+    if (py_as_sensor_data(state, obj, &data, &pool) != 0) {
+        goto done;
+    }
+
+    int32_t payload_size = get_sensor_data_size(&data);
+    if (payload_size < 0) {
+        set_protoc_error(state, payload_size);
+        goto done;
+    }
+    size_t size = 3 + varint_size((uint64_t) payload_size) + (size_t) payload_size;
+    uint8_t *p_buff = out_buffer_reserve(out, size);
+    if (p_buff == NULL) {
+        goto done;
+    }
+    size_t rem_buff = size;
+    beta_protoc_err_t err = sensor_data_to_message(&data, &p_buff, &rem_buff);
+    if (err != 0) {
+        set_protoc_error(state, err);
+        goto done;
+    }
+    out->len += size - rem_buff;
+    ret = 0;
+
+done:
+    pool_free(&pool);
+    return ret;
+}
+
+static PyObject *decode_sensor_data(module_state *state, uint8_t **buff, size_t *rem_buff, uint8_t *payload, size_t payload_len) {
+    pool_t pool = {NULL};
+    SensorData data;
+    memset(&data, 0, sizeof(data));
+    PyObject *result = NULL;
+
+    if (prepare_sensor_data(&data, &pool, payload, payload_len) != 0) {
+        goto done;
+    }
+
+    beta_protoc_err_t err = sensor_data_from_message(&data, buff, rem_buff);
+    if (err != 0) {
+        set_protoc_error(state, err);
+        goto done;
+    }
+    result = py_from_sensor_data(state, &data);
+
+done:
+    pool_free(&pool);
+    return result;
+}
+
+static PyStructSequence_Field value_fields[] = {
+    {"value", "uint32 (ID: 0)"},
+    {"unit", "char[32] (ID: 1)"},
+    {NULL, NULL}
+};
+
+static PyStructSequence_Desc value_desc = {
+    "beta_protoc_generated.Value",
+    "Value message (ID: 1).",
+    value_fields,
+    2
+};
+
+static int py_as_value(module_state *state, PyObject *obj, Value *data, pool_t *pool) {
+    if (!PyObject_TypeCheck(obj, state->value_type)) {
+        PyErr_SetString(PyExc_TypeError, "expected a Value message");
+        return -1;
+    }
+    (void) data;
+    (void) pool;
+    // Field: value
+    {
+        PyObject *item = PyStructSequence_GetItem(obj, 0);
+        if (py_as_uint32(item, &data->value) != 0) {
+            return -1;
+        }
+    }
+    // Field: unit
+    {
+        PyObject *item = PyStructSequence_GetItem(obj, 1);
+        PyObject *encoded = py_encode_str(item);
+        if (encoded == NULL) {
+            return -1;
+        }
+        size_t len = (size_t) PyBytes_Size(encoded);
+        if (len > 32) {
+            Py_DECREF(encoded);
+            PyErr_SetString(PyExc_ValueError, "Value.unit is longer than 32 bytes");
+            return -1;
+        }
+        memcpy(data->unit, PyBytes_AsString(encoded), len);
+        data->unit_count = len;
+        Py_DECREF(encoded);
+    }
+    return 0;
+}
+
+static PyObject *py_from_value(module_state *state, const Value *data) {
+    PyObject *obj = PyStructSequence_New(state->value_type);
+    if (obj == NULL) {
+        return NULL;
+    }
+    (void) data;
+    // Field: value
+    {
+        PyObject *value = py_from_uint32(data->value);
+        if (value == NULL) {
+            Py_DECREF(obj);
+            return NULL;
+        }
+        PyStructSequence_SetItem(obj, 0, value);
+    }
+    // Field: unit
+    {
+        PyObject *value = py_decode_str(data->unit, data->unit_count);
+        if (value == NULL) {
+            Py_DECREF(obj);
+            return NULL;
+        }
+        PyStructSequence_SetItem(obj, 1, value);
+    }
+    return obj;
+}
+
+// Provides the dynamic arrays with storage for the elements of the payload before deserialization.
+// Each array only gets room for the elements its fields can hold, so that the storage stays linear in the payload size.
+static int prepare_value(Value *data, pool_t *pool, uint8_t *payload, size_t payload_len) {
+    (void) data;
+    (void) pool;
+    (void) payload;
+    (void) payload_len;
+    return 0;
+}
+
+static int encode_value(module_state *state, PyObject *obj, out_buffer_t *out) {
+    pool_t pool = {NULL};
+    Value data;
+    memset(&data, 0, sizeof(data));
+    int ret = -1;
+
+    if (py_as_value(state, obj, &data, &pool) != 0) {
+        goto done;
+    }
+
+    int32_t payload_size = get_value_size(&data);
+    if (payload_size < 0) {
+        set_protoc_error(state, payload_size);
+        goto done;
+    }
+    size_t size = 3 + varint_size((uint64_t) payload_size) + (size_t) payload_size;
+    uint8_t *p_buff = out_buffer_reserve(out, size);
+    if (p_buff == NULL) {
+        goto done;
+    }
+    size_t rem_buff = size;
+    beta_protoc_err_t err = value_to_message(&data, &p_buff, &rem_buff);
+    if (err != 0) {
+        set_protoc_error(state, err);
+        goto done;
+    }
+    out->len += size - rem_buff;
+    ret = 0;
+
+done:
+    pool_free(&pool);
+    return ret;
+}
+
+static PyObject *decode_value(module_state *state, uint8_t **buff, size_t *rem_buff, uint8_t *payload, size_t payload_len) {
+    pool_t pool = {NULL};
+    Value data;
+    memset(&data, 0, sizeof(data));
+    PyObject *result = NULL;
+
+    if (prepare_value(&data, &pool, payload, payload_len) != 0) {
+        goto done;
+    }
+
+    beta_protoc_err_t err = value_from_message(&data, buff, rem_buff);
+    if (err != 0) {
+        set_protoc_error(state, err);
+        goto done;
+    }
+    result = py_from_value(state, &data);
+
+done:
+    pool_free(&pool);
+    return result;
+}
+
+// --- Dispatch on message type ---
+
+static int encode_message(module_state *state, PyObject *obj, out_buffer_t *out) {
+    if (PyObject_TypeCheck(obj, state->sensor_data_type)) {
+        return encode_sensor_data(state, obj, out);
+    }
+    if (PyObject_TypeCheck(obj, state->value_type)) {
+        return encode_value(state, obj, out);
+    }
+    (void) state;
+    (void) obj;
+    (void) out;
+    PyErr_SetString(PyExc_TypeError, "expected a message");
+    return -1;
+}
+
+static PyObject *decode_message(module_state *state, uint8_t **buff, size_t *rem_buff) {
+    if (*rem_buff < 3) {
+        set_protoc_error(state, BETA_PROTOC_ERR_INVALID_DATA);
+        return NULL;
+    }
+
+    // Locate the payload, whose fields size the dynamic arrays (left empty if the header is invalid, which the decoder reports)
+    uint8_t *payload = *buff;
+    size_t payload_len = 0;
+    {
+        uint8_t *p_buff = *buff + 3;
+        size_t rem = *rem_buff - 3;
+        uint64_t len;
+        if (varint_from_buff(&len, &p_buff, &rem) == 0 && len <= rem) {
+            payload = p_buff;
+            payload_len = (size_t) len;
+        }
+    }
+
+    switch (((uint16_t) (*buff)[2] << 8) | (uint16_t) (*buff)[1]) {
+        case 0:
+            return decode_sensor_data(state, buff, rem_buff, payload, payload_len);
+        case 1:
+            return decode_value(state, buff, rem_buff, payload, payload_len);
+        default:
+            (void) payload;
+            (void) payload_len;
+            set_protoc_error(state, BETA_PROTOC_ERR_INVALID_ID);
+            return NULL;
+    }
+}
+
+// --- Module functions ---
+
+static PyObject *module_encode(PyObject *module, PyObject *msg) {
+    module_state *state = PyModule_GetState(module);
+    out_buffer_t out = {NULL, 0, 0};
+    PyObject *result = NULL;
+
+    if (encode_message(state, msg, &out) == 0) {
+        result = PyBytes_FromStringAndSize((const char *) out.data, (Py_ssize_t) out.len);
+    }
+    PyMem_Free(out.data);
+    return result;
+}
+
+static PyObject *module_encode_all(PyObject *module, PyObject *msgs) {
+    module_state *state = PyModule_GetState(module);
+    out_buffer_t out = {NULL, 0, 0};
+    PyObject *result = NULL;
+
+    PyObject *iterator = PyObject_GetIter(msgs);
+    if (iterator == NULL) {
+        return NULL;
+    }
+    PyObject *msg;
+    while ((msg = PyIter_Next(iterator)) != NULL) {
+        int err = encode_message(state, msg, &out);
+        Py_DECREF(msg);
+        if (err != 0) {
+            break;
+        }
+    }
+    Py_DECREF(iterator);
+
+    if (!PyErr_Occurred()) {
+        result = PyBytes_FromStringAndSize((const char *) out.data, (Py_ssize_t) out.len);
+    }
+    PyMem_Free(out.data);
+    return result;
+}
+
+static PyObject *module_decode(PyObject *module, PyObject *data) {
+    module_state *state = PyModule_GetState(module);
+    Py_buffer view;
+    if (PyObject_GetBuffer(data, &view, PyBUF_SIMPLE) != 0) {
+        return NULL;
+    }
+
+    uint8_t *p_buff = view.buf;
+    size_t rem_buff = (size_t) view.len;
+    PyObject *result = decode_message(state, &p_buff, &rem_buff);
+    if (result != NULL && rem_buff != 0) {
+        Py_CLEAR(result);
+        PyErr_SetString(PyExc_ValueError, "trailing data after the message");
+    }
+
+    PyBuffer_Release(&view);
+    return result;
+}
+
+static PyObject *module_decode_all(PyObject *module, PyObject *data) {
+    module_state *state = PyModule_GetState(module);
+    Py_buffer view;
+    if (PyObject_GetBuffer(data, &view, PyBUF_SIMPLE) != 0) {
+        return NULL;
+    }
+
+    PyObject *result = PyList_New(0);
+    uint8_t *p_buff = view.buf;
+    size_t rem_buff = (size_t) view.len;
+    while (result != NULL && rem_buff > 0) {
+        PyObject *msg = decode_message(state, &p_buff, &rem_buff);
+        if (msg == NULL || PyList_Append(result, msg) != 0) {
+            Py_CLEAR(result);
+        }
+        Py_XDECREF(msg);
+    }
+
+    PyBuffer_Release(&view);
+    return result;
+}
+
+static PyMethodDef module_methods[] = {
+    {"encode", module_encode, METH_O,
+     "encode(msg) -> bytes\n\nSerializes a message into a complete binary message (header + payload)."},
+    {"encode_all", module_encode_all, METH_O,
+     "encode_all(msgs) -> bytes\n\nSerializes an iterable of messages into concatenated binary messages."},
+    {"decode", module_decode, METH_O,
+     "decode(data) -> message\n\nDeserializes a single binary message from a bytes-like object, without copying it."},
+    {"decode_all", module_decode_all, METH_O,
+     "decode_all(data) -> list\n\nDeserializes all the concatenated binary messages of a bytes-like object, without copying it."},
+    {NULL, NULL, 0, NULL}
+};
+
+// --- Module definition ---
+
+static int module_traverse(PyObject *module, visitproc visit, void *arg) {
+    module_state *state = PyModule_GetState(module);
+    Py_VISIT(state->error);
+    Py_VISIT(state->sensor_data_type);
+    Py_VISIT(state->value_type);
+    return 0;
+}
+
+static int module_clear(PyObject *module) {
+    module_state *state = PyModule_GetState(module);
+    Py_CLEAR(state->error);
+    Py_CLEAR(state->sensor_data_type);
+    Py_CLEAR(state->value_type);
+    return 0;
+}
+
+static void module_free(void *module) {
+    module_clear((PyObject *) module);
+}
+
+static struct PyModuleDef module_def = {
+    PyModuleDef_HEAD_INIT,
+    "beta_protoc_generated",
+    "Message types and native codecs generated by beta_protoc.",
+    sizeof(module_state),
+    module_methods,
+    NULL,
+    module_traverse,
+    module_clear,
+    module_free
+};
+
+// Creates a message type and adds it to the module
+static PyTypeObject *add_message_type(PyObject *module, PyStructSequence_Desc *desc, const char *name, long id) {
+    PyTypeObject *type = PyStructSequence_NewType(desc);
+    if (type == NULL) {
+        return NULL;
+    }
+    PyObject *py_id = PyLong_FromLong(id);
+    if (py_id == NULL || PyObject_SetAttrString((PyObject *) type, "ID", py_id) != 0
+        || PyModule_AddObjectRef(module, name, (PyObject *) type) != 0) {
+        Py_XDECREF(py_id);
+        Py_DECREF(type);
+        return NULL;
+    }
+    Py_DECREF(py_id);
+    return type;
+}
+
+PyMODINIT_FUNC PyInit_beta_protoc_generated(void) {
+    PyObject *module = PyModule_Create(&module_def);
+    if (module == NULL) {
+        return NULL;
+    }
+    module_state *state = PyModule_GetState(module);
+
+    state->error = PyErr_NewException("beta_protoc_generated.ProtocError", PyExc_ValueError, NULL);
+    if (state->error == NULL || PyModule_AddObjectRef(module, "ProtocError", state->error) != 0) {
+        goto error;
+    }
+    if (PyModule_AddIntConstant(module, "PROTOC_VERSION", PROTOC_VERSION) != 0) {
+        goto error;
+    }
+    state->sensor_data_type = add_message_type(module, &sensor_data_desc, "SensorData", 0);
+    if (state->sensor_data_type == NULL) {
+        goto error;
+    }
+    state->value_type = add_message_type(module, &value_desc, "Value", 1);
+    if (state->value_type == NULL) {
+        goto error;
+    }
+
+    return module;
+
+error:
+    Py_DECREF(module);
+    return NULL;
+}
\ No newline at end of file
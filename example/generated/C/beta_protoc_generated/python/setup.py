@@ -0,0 +1,42 @@
+"""Builds the beta_protoc_generated CPython extension module with the system C compiler.
+
+The module only uses the limited C API (Python >= 3.11), so the built module is compatible with
+all later Python versions. The path to the beta_protoc C common code
+(`protoc_common_code/C/beta_protoc`) must be given through the BETA_PROTOC_DIR environment variable:
+
+    BETA_PROTOC_DIR=/path/to/protoc_common_code/C/beta_protoc pip install .
+"""
+import os
+import pathlib
+
+from setuptools import setup, Extension
+
+HERE = pathlib.Path(__file__).parent.resolve()
+GENERATED_DIR = HERE.parent
+
+if "BETA_PROTOC_DIR" not in os.environ:
+    raise SystemExit("Error: the BETA_PROTOC_DIR environment variable must point to protoc_common_code/C/beta_protoc.")
+BETA_PROTOC_DIR = pathlib.Path(os.environ["BETA_PROTOC_DIR"]).resolve()
+
+sources = [
+    HERE / "beta_protoc_generated.c",
+    BETA_PROTOC_DIR / "src" / "beta_protoc.c",
+    GENERATED_DIR / "src" / "SensorData.c",
+    GENERATED_DIR / "src" / "Value.c",
+]
+
+setup(
+    name="beta_protoc_generated",
+    version="0.0.0",
+    ext_modules=[
+        Extension(
+            "beta_protoc_generated",
+            # Absolute paths keep the object files inside the build directory
+            sources=[str(src) for src in sources],
+            include_dirs=[str(BETA_PROTOC_DIR / "include"), str(GENERATED_DIR / "include")],
+            define_macros=[("Py_LIMITED_API", "0x030B0000")],
+            py_limited_api=True,
+        )
+    ],
+    options={"bdist_wheel": {"py_limited_api": "cp311"}},
+)
\ No newline at end of file
@@ -1,5 +1,13 @@
 #include "SensorData.h"
 
+// Dictionary of the name field, its entries are sent as their index
+static const beta_protoc_dict_entry_t sensor_data_name_dictionary[4] = {
+    { "temperature", 11 },
+    { "humidity", 8 },
+    { "pressure", 8 },
+    { "luminosity", 10 },
+};
+
 int32_t get_sensor_data_size(const SensorData *data) {
     if (data == NULL) {
         return BETA_PROTOC_ERR_INVALID_ARGS;
@@ -23,18 +31,8 @@ int32_t get_sensor_data_size(const SensorData *data) {
     }
     // Field: name
     {
-        size_t field_size = 0;
-        
-        for (size_t i = 0; i < data->name_count; i++) {
-        
-        // Special case for char type to avoid counting after null-terminator
-        if (data->name[i] == '\0') {
-            break;
-        }
-        
-        // Primitive type size calculation
-        field_size += char_size(data->name[i]);
-        }
+        // Dictionary index or literal string size calculation
+        size_t field_size = dict_string_size(sensor_data_name_dictionary, 4, data->name, safe_strlen(data->name, data->name_count));
 
         // Add size of field length (varint) and field ID (varint)
         field_size += varint_size(field_size);
@@ -101,39 +99,19 @@ beta_protoc_err_t sensor_data_to_buff(const SensorData *data, uint8_t **buff, si
         if (id_varint_err != 0) {
             return id_varint_err;
         }
-        
-        // Serialize field length (sum of all elements size for primitive arrays)
-        size_t array_size = 0;
-        for (size_t i = 0; i < data->name_count; i++) {
-            
-            // Special case for char type to avoid counting after null-terminator
-            if (data->name[i] == '\0') {
-                break;
-            }
-            
-            array_size += char_size(data->name[i]);
-        }
-        beta_protoc_err_t len_varint_err = varint_to_buff(array_size, buff, rem_buff);
+
+        // Serialize field length
+        size_t str_len = safe_strlen(data->name, data->name_count);
+        beta_protoc_err_t len_varint_err = varint_to_buff(dict_string_size(sensor_data_name_dictionary, 4, data->name, str_len), buff, rem_buff);
         if (len_varint_err != 0) {
             return len_varint_err;
         }
 
-        for (size_t i = 0; i < data->name_count; i++) {
-
-        
-        // Special case for char type to avoid writing after null-terminator
-        if (data->name[i] == '\0') {
-            break;
-        }
-        
-        
-
-        // Serialize value
-        beta_protoc_err_t field_err = char_to_buff(data->name[i], buff, rem_buff);
+        // Serialize value (dictionary index on a hit, literal string on a miss)
+        beta_protoc_err_t field_err = dict_string_to_buff(sensor_data_name_dictionary, 4, data->name, str_len, buff, rem_buff);
         if (field_err != 0) {
             return field_err;
         }
-        }
     }
     // Field: value
     {
@@ -258,16 +236,9 @@ beta_protoc_err_t sensor_data_from_buff(SensorData *data, uint8_t **buff, size_t
                 uint8_t *field_start_buff = *buff;
 
                 // Deserialize field value
-                
-                while (*buff - field_start_buff < field_len) {
-                    beta_protoc_err_t field_err = char_from_buff(&(data->name[data->name_count]), buff, rem_buff);
-                    if (field_err != 0) {
-                        return field_err;
-                    }
-                    data->name_count++;
-                    if (data->name_count > 32) {
-                        return BETA_PROTOC_ERR_ARRAY_SIZE_EXCEEDED;
-                    }
+                beta_protoc_err_t field_err = dict_string_from_buff(sensor_data_name_dictionary, 4, data->name, &data->name_count, 32, field_len, buff, rem_buff);
+                if (field_err != 0) {
+                    return field_err;
                 }
 
                 // Check if the correct number of bytes were read
@@ -307,7 +278,9 @@ beta_protoc_err_t sensor_data_from_buff(SensorData *data, uint8_t **buff, size_t
     }
 
     // Null-terminate strings
-    data->name[data->name_count] = '\0';
+    if (data->name_count < 32) {
+        data->name[data->name_count] = '\0';
+    }
 
     return BETA_PROTOC_SUCCESS;
 }
@@ -1,5 +1,14 @@
 #include "Value.h"
 
+// Dictionary of the unit field, its entries are sent as their index
+static const beta_protoc_dict_entry_t value_unit_dictionary[5] = {
+    { "celsius", 7 },
+    { "fahrenheit", 10 },
+    { "percent", 7 },
+    { "pascal", 6 },
+    { "lux", 3 },
+};
+
 int32_t get_value_size(const Value *data) {
     if (data == NULL) {
         return BETA_PROTOC_ERR_INVALID_ARGS;
@@ -23,18 +32,8 @@ int32_t get_value_size(const Value *data) {
     }
     // Field: unit
     {
-        size_t field_size = 0;
-        
-        for (size_t i = 0; i < data->unit_count; i++) {
-        
-        // Special case for char type to avoid counting after null-terminator
-        if (data->unit[i] == '\0') {
-            break;
-        }
-        
-        // Primitive type size calculation
-        field_size += char_size(data->unit[i]);
-        }
+        // Dictionary index or literal string size calculation
+        size_t field_size = dict_string_size(value_unit_dictionary, 5, data->unit, safe_strlen(data->unit, data->unit_count));
 
         // Add size of field length (varint) and field ID (varint)
         field_size += varint_size(field_size);
@@ -80,39 +79,19 @@ beta_protoc_err_t value_to_buff(const Value *data, uint8_t **buff, size_t *rem_b
         if (id_varint_err != 0) {
             return id_varint_err;
         }
-        
-        // Serialize field length (sum of all elements size for primitive arrays)
-        size_t array_size = 0;
-        for (size_t i = 0; i < data->unit_count; i++) {
-            
-            // Special case for char type to avoid counting after null-terminator
-            if (data->unit[i] == '\0') {
-                break;
-            }
-            
-            array_size += char_size(data->unit[i]);
-        }
-        beta_protoc_err_t len_varint_err = varint_to_buff(array_size, buff, rem_buff);
+
+        // Serialize field length
+        size_t str_len = safe_strlen(data->unit, data->unit_count);
+        beta_protoc_err_t len_varint_err = varint_to_buff(dict_string_size(value_unit_dictionary, 5, data->unit, str_len), buff, rem_buff);
         if (len_varint_err != 0) {
             return len_varint_err;
         }
 
-        for (size_t i = 0; i < data->unit_count; i++) {
-
-        
-        // Special case for char type to avoid writing after null-terminator
-        if (data->unit[i] == '\0') {
-            break;
-        }
-        
-        
-
-        // Serialize value
-        beta_protoc_err_t field_err = char_to_buff(data->unit[i], buff, rem_buff);
+        // Serialize value (dictionary index on a hit, literal string on a miss)
+        beta_protoc_err_t field_err = dict_string_to_buff(value_unit_dictionary, 5, data->unit, str_len, buff, rem_buff);
         if (field_err != 0) {
             return field_err;
         }
-        }
     }
     return BETA_PROTOC_SUCCESS;
 }
@@ -213,16 +192,9 @@ beta_protoc_err_t value_from_buff(Value *data, uint8_t **buff, size_t *rem_buff)
                 uint8_t *field_start_buff = *buff;
 
                 // Deserialize field value
-                
-                while (*buff - field_start_buff < field_len) {
-                    beta_protoc_err_t field_err = char_from_buff(&(data->unit[data->unit_count]), buff, rem_buff);
-                    if (field_err != 0) {
-                        return field_err;
-                    }
-                    data->unit_count++;
-                    if (data->unit_count > 32) {
-                        return BETA_PROTOC_ERR_ARRAY_SIZE_EXCEEDED;
-                    }
+                beta_protoc_err_t field_err = dict_string_from_buff(value_unit_dictionary, 5, data->unit, &data->unit_count, 32, field_len, buff, rem_buff);
+                if (field_err != 0) {
+                    return field_err;
                 }
 
                 // Check if the correct number of bytes were read
@@ -243,7 +215,9 @@ beta_protoc_err_t value_from_buff(Value *data, uint8_t **buff, size_t *rem_buff)
     }
 
     // Null-terminate strings
-    data->unit[data->unit_count] = '\0';
+    if (data->unit_count < 32) {
+        data->unit[data->unit_count] = '\0';
+    }
 
     return BETA_PROTOC_SUCCESS;
 }
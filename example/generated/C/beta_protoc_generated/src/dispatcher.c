@@ -1,5 +1,87 @@
 #include "dispatcher.h"
 
+// Deserializes a message and calls its handler
+typedef int (*protoc_dispatch_func_t)(protoc_handler_t handler, uint8_t **buff, size_t *rem_buff, void *ctx);
+
+static int dispatch_sensor_data(protoc_handler_t handler, uint8_t **buff, size_t *rem_buff, void *ctx) {
+    SensorData msg;
+    int result = sensor_data_from_message(&msg, buff, rem_buff);
+    if (result != 0) {
+        return result;
+    }
+
+    ((sensor_data_handler_t) handler)(&msg, ctx);
+    return DISPATCHER_SUCCESS;
+}
+
+static int dispatch_value(protoc_handler_t handler, uint8_t **buff, size_t *rem_buff, void *ctx) {
+    Value msg;
+    int result = value_from_message(&msg, buff, rem_buff);
+    if (result != 0) {
+        return result;
+    }
+
+    ((value_handler_t) handler)(&msg, ctx);
+    return DISPATCHER_SUCCESS;
+}
+
+// A message's slot is its index in the messages sorted by ID.
+// Deserialization functions by slot, never modified so that they can stay in read-only memory
+static const protoc_dispatch_func_t dispatch_table[2] = {
+    dispatch_sensor_data,
+    dispatch_value,
+};
+
+// Handlers by slot (NULL if the message is not handled), the weak callbacks are the initial handlers
+static protoc_handler_t handler_table[2] = {
+    (protoc_handler_t) on_sensor_data_received,
+    (protoc_handler_t) on_value_received,
+};
+
+// Returns the slot of a message ID, or -1 if no message has this ID
+static int find_slot(uint16_t msg_id) {
+    switch (msg_id) {
+        case 0: return 0;
+        case 1: return 1;
+        default: return -1;
+    }
+}
+
+void protoc_register_sensor_data_handler(sensor_data_handler_t handler) {
+    handler_table[0] = (protoc_handler_t) handler;
+}
+
+void protoc_unregister_sensor_data_handler(void) {
+    handler_table[0] = NULL;
+}
+
+void protoc_register_value_handler(value_handler_t handler) {
+    handler_table[1] = (protoc_handler_t) handler;
+}
+
+void protoc_unregister_value_handler(void) {
+    handler_table[1] = NULL;
+}
+
+// Advances the buffer past a message without deserializing its payload
+static int skip_message(uint8_t **buff, size_t *rem_buff) {
+    uint8_t *p_buff = *buff + 3;
+    size_t rem = *rem_buff - 3;
+
+    uint64_t payload_len;
+    beta_protoc_err_t len_varint_err = varint_from_buff(&payload_len, &p_buff, &rem);
+    if (len_varint_err != 0) {
+        return len_varint_err;
+    }
+    if (payload_len > rem) {
+        return BETA_PROTOC_ERR_INVALID_DATA;
+    }
+
+    *buff = p_buff + payload_len;
+    *rem_buff = rem - (size_t) payload_len;
+    return DISPATCHER_SUCCESS;
+}
+
 int protoc_dispatch(uint8_t **buff, size_t *rem_buff, void *ctx) {
     uint8_t *p_buff = *buff;
 
@@ -12,35 +94,18 @@ int protoc_dispatch(uint8_t **buff, size_t *rem_buff, void *ctx) {
         return DISPATCHER_ERR_INVALID_PROTOC_VERSION;
     }
 
-    // Dispatch based on message ID (little-endian)
-    switch (((uint16_t) p_buff[2] << 8) | (uint16_t) p_buff[1]) {
-        case 0: {
-            SensorData msg;
-            int result = sensor_data_from_message(&msg, buff, rem_buff);
-            if (result != 0) {
-                return result;
-            }
-
-            // Call the user-implemented callback for the received message
-            if (on_sensor_data_received != NULL) {
-                on_sensor_data_received(&msg, ctx);
-            }
-            return DISPATCHER_SUCCESS;
-        }
-        case 1: {
-            Value msg;
-            int result = value_from_message(&msg, buff, rem_buff);
-            if (result != 0) {
-                return result;
-            }
-
-            // Call the user-implemented callback for the received message
-            if (on_value_received != NULL) {
-                on_value_received(&msg, ctx);
-            }
-            return DISPATCHER_SUCCESS;
-        }
-        default:
-            return DISPATCHER_ERR_UNKNOWN_MESSAGE_ID;
+    // Look the slot of the message ID (little-endian) up
+    uint16_t msg_id = ((uint16_t) p_buff[2] << 8) | (uint16_t) p_buff[1];
+    int slot = find_slot(msg_id);
+    if (slot < 0) {
+        return DISPATCHER_ERR_UNKNOWN_MESSAGE_ID;
     }
+    protoc_handler_t handler = handler_table[slot];
+
+    // Skip messages nobody handles without deserializing them
+    if (handler == NULL) {
+        return skip_message(buff, rem_buff);
+    }
+
+    return dispatch_table[slot](handler, buff, rem_buff, ctx);
 }
\ No newline at end of file
@@ -0,0 +1,520 @@
+#ifndef BETA_PROTOC_HPP
+#define BETA_PROTOC_HPP
+
+#include <array>
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <type_traits>
+
+namespace beta_protoc {
+
+constexpr std::uint8_t PROTOCOL_VERSION = 1;
+
+// Error codes, numerically identical to the C runtime's beta_protoc_err_t
+enum class Error : int {
+    Success = 0,
+    InvalidArgs = -1, // Invalid arguments passed as parameters
+    BufferTooSmall = -2, // Output buffer too small
+    InvalidId = -3, // Message ID does not match the struct
+    InvalidProtocVersion = -4, // Protoc version does not match
+    ValueExceedsArchLimit = -5, // Value exceeds architecture limits (e.g., varint too large for 32 bits size_t)
+    InvalidData = -6, // General data error
+    ArraySizeExceeded = -7, // Array size exceeded for fixed-size arrays
+    NullArrayPointer = -8 // Empty view passed for a dynamic array field
+};
+
+/**
+ * @brief Minimal C++17 stand-in for std::span.
+ *
+ * Used both for the caller-provided encode/decode buffers and for dynamic array fields,
+ * where size() is the capacity of the storage (the C runtime's `<field>_max_count`).
+ */
+template <typename T>
+class span {
+public:
+    using element_type = T;
+    using value_type = std::remove_cv_t<T>;
+    using iterator = T *;
+
+    constexpr span() noexcept = default;
+    constexpr span(T *data, std::size_t size) noexcept : data_(data), size_(size) {}
+
+    template <std::size_t N>
+    constexpr span(T (&arr)[N]) noexcept : data_(arr), size_(N) {}
+
+    template <typename U, std::size_t N, typename = std::enable_if_t<std::is_convertible_v<U (*)[], T (*)[]>>>
+    constexpr span(std::array<U, N> &arr) noexcept : data_(arr.data()), size_(N) {}
+
+    template <typename U, std::size_t N, typename = std::enable_if_t<std::is_convertible_v<const U (*)[], T (*)[]>>>
+    constexpr span(const std::array<U, N> &arr) noexcept : data_(arr.data()), size_(N) {}
+
+    template <typename U, typename = std::enable_if_t<std::is_convertible_v<U (*)[], T (*)[]>>>
+    constexpr span(const span<U> &other) noexcept : data_(other.data()), size_(other.size()) {}
+
+    constexpr T *data() const noexcept { return data_; }
+    constexpr std::size_t size() const noexcept { return size_; }
+    constexpr bool empty() const noexcept { return size_ == 0; }
+    constexpr T &operator[](std::size_t i) const noexcept { return data_[i]; }
+    constexpr iterator begin() const noexcept { return data_; }
+    constexpr iterator end() const noexcept { return data_ + size_; }
+
+    constexpr span subspan(std::size_t offset) const noexcept { return span(data_ + offset, size_ - offset); }
+    constexpr span subspan(std::size_t offset, std::size_t count) const noexcept { return span(data_ + offset, count); }
+
+private:
+    T *data_ = nullptr;
+    std::size_t size_ = 0;
+};
+
+/**
+ * @brief Sequential writer over a caller-provided output buffer.
+ */
+class Writer {
+public:
+    constexpr explicit Writer(span<std::uint8_t> out) noexcept
+        : begin_(out.data()), cur_(out.data()), end_(out.data() + out.size()) {}
+
+    constexpr std::size_t remaining() const noexcept { return static_cast<std::size_t>(end_ - cur_); }
+    constexpr std::size_t written() const noexcept { return static_cast<std::size_t>(cur_ - begin_); }
+
+    [[nodiscard]] constexpr Error put(std::uint8_t byte) noexcept {
+        if (cur_ == end_) {
+            return Error::BufferTooSmall;
+        }
+        *cur_++ = byte;
+        return Error::Success;
+    }
+
+    [[nodiscard]] inline Error put(const void *data, std::size_t len) noexcept {
+        if (remaining() < len) {
+            return Error::BufferTooSmall;
+        }
+        if (len > 0) {
+            std::memcpy(cur_, data, len);
+        }
+        cur_ += len;
+        return Error::Success;
+    }
+
+private:
+    std::uint8_t *begin_;
+    std::uint8_t *cur_;
+    std::uint8_t *end_;
+};
+
+/**
+ * @brief Sequential reader over a caller-provided input buffer.
+ */
+class Reader {
+public:
+    constexpr explicit Reader(span<const std::uint8_t> in) noexcept
+        : begin_(in.data()), cur_(in.data()), end_(in.data() + in.size()) {}
+
+    constexpr std::size_t remaining() const noexcept { return static_cast<std::size_t>(end_ - cur_); }
+    constexpr std::size_t consumed() const noexcept { return static_cast<std::size_t>(cur_ - begin_); }
+    constexpr const std::uint8_t *position() const noexcept { return cur_; }
+
+    [[nodiscard]] constexpr Error get(std::uint8_t &byte) noexcept {
+        if (cur_ == end_) {
+            return Error::BufferTooSmall;
+        }
+        byte = *cur_++;
+        return Error::Success;
+    }
+
+    [[nodiscard]] inline Error get(void *data, std::size_t len) noexcept {
+        if (remaining() < len) {
+            return Error::BufferTooSmall;
+        }
+        if (len > 0) {
+            std::memcpy(data, cur_, len);
+        }
+        cur_ += len;
+        return Error::Success;
+    }
+
+    [[nodiscard]] constexpr Error skip(std::size_t len) noexcept {
+        if (remaining() < len) {
+            return Error::InvalidData;
+        }
+        cur_ += len;
+        return Error::Success;
+    }
+
+    /**
+     * @brief Returns a reader limited to the next `len` bytes, without advancing this one.
+     */
+    constexpr Reader sub(std::size_t len) const noexcept {
+        return Reader(span<const std::uint8_t>(cur_, len));
+    }
+
+private:
+    const std::uint8_t *begin_;
+    const std::uint8_t *cur_;
+    const std::uint8_t *end_;
+};
+
+/**
+ * @brief Compile-time description of a message field.
+ */
+struct FieldDescriptor {
+    std::uint64_t id;
+    const char *name;
+    const char *type;
+    bool is_primitive;
+    bool is_array;
+    bool is_dynamic;
+    std::size_t array_size; // 0 for scalars and dynamic arrays
+};
+
+constexpr std::uint32_t zigzag_encode_32(std::int32_t value) noexcept {
+    return (static_cast<std::uint32_t>(value) << 1) ^ static_cast<std::uint32_t>(value >> 31);
+}
+
+constexpr std::int32_t zigzag_decode_32(std::uint32_t value) noexcept {
+    return static_cast<std::int32_t>((value >> 1) ^ (~(value & 1) + 1));
+}
+
+constexpr std::uint64_t zigzag_encode_64(std::int64_t value) noexcept {
+    return (static_cast<std::uint64_t>(value) << 1) ^ static_cast<std::uint64_t>(value >> 63);
+}
+
+constexpr std::int64_t zigzag_decode_64(std::uint64_t value) noexcept {
+    return static_cast<std::int64_t>((value >> 1) ^ (~(value & 1) + 1));
+}
+
+constexpr std::size_t varint_size(std::uint64_t data) noexcept {
+    std::size_t out_size = 0;
+    do {
+        out_size++;
+        data >>= 7;
+    } while (data != 0);
+    return out_size;
+}
+
+[[nodiscard]] constexpr Error varint_to_buff(std::uint64_t data, Writer &writer) noexcept {
+    do {
+        std::uint8_t byte = data & 0x7F;
+        data >>= 7;
+        if (data != 0) {
+            byte |= 0x80; // More bytes to come
+        }
+        Error err = writer.put(byte);
+        if (err != Error::Success) {
+            return err;
+        }
+    } while (data != 0);
+    return Error::Success;
+}
+
+[[nodiscard]] constexpr Error varint_from_buff(std::uint64_t &data, Reader &reader) noexcept {
+    data = 0;
+    for (std::uint8_t shift = 0; shift < 64; shift += 7) {
+        std::uint8_t byte = 0;
+        Error err = reader.get(byte);
+        if (err != Error::Success) {
+            return err;
+        }
+        data |= static_cast<std::uint64_t>(byte & 0x7F) << shift;
+        if ((byte & 0x80) == 0) {
+            return Error::Success;
+        }
+    }
+    return Error::InvalidData;
+}
+
+/**
+ * @brief Reads a varint length and checks that it fits in a size_t.
+ */
+[[nodiscard]] constexpr Error length_from_buff(std::size_t &len, Reader &reader) noexcept {
+    std::uint64_t tmp = 0;
+    Error err = varint_from_buff(tmp, reader);
+    if (err != Error::Success) {
+        return err;
+    }
+    if (tmp > SIZE_MAX) {
+        return Error::ValueExceedsArchLimit;
+    }
+    len = static_cast<std::size_t>(tmp);
+    return Error::Success;
+}
+
+template <std::size_t Size>
+[[nodiscard]] constexpr Error write_unsigned(std::uint64_t data, Writer &writer) noexcept {
+    if (writer.remaining() < Size) {
+        return Error::BufferTooSmall;
+    }
+    for (std::size_t i = 0; i < Size; i++) {
+        (void) writer.put(static_cast<std::uint8_t>(data & 0xFF));
+        data >>= 8;
+    }
+    return Error::Success;
+}
+
+template <std::size_t Size>
+[[nodiscard]] constexpr Error read_unsigned(std::uint64_t &data, Reader &reader) noexcept {
+    if (reader.remaining() < Size) {
+        return Error::BufferTooSmall;
+    }
+    data = 0;
+    for (std::size_t i = 0; i < Size; i++) {
+        std::uint8_t byte = 0;
+        (void) reader.get(byte);
+        data |= static_cast<std::uint64_t>(byte) << (8 * i);
+    }
+    return Error::Success;
+}
+
+// Encoded sizes
+constexpr std::size_t int8_size(std::int8_t) noexcept { return 1; }
+constexpr std::size_t int16_size(std::int16_t) noexcept { return 2; }
+constexpr std::size_t uint8_size(std::uint8_t) noexcept { return 1; }
+constexpr std::size_t uint16_size(std::uint16_t) noexcept { return 2; }
+constexpr std::size_t int32_size(std::int32_t data) noexcept { return varint_size(zigzag_encode_32(data)); }
+constexpr std::size_t int64_size(std::int64_t data) noexcept { return varint_size(zigzag_encode_64(data)); }
+constexpr std::size_t uint32_size(std::uint32_t data) noexcept { return varint_size(data); }
+constexpr std::size_t uint64_size(std::uint64_t data) noexcept { return varint_size(data); }
+constexpr std::size_t float32_size(float) noexcept { return 4; }
+constexpr std::size_t float64_size(double) noexcept { return 8; }
+constexpr std::size_t char_size(char) noexcept { return 1; }
+constexpr std::size_t bool_size(bool) noexcept { return 1; }
+
+// Serialization
+[[nodiscard]] constexpr Error int8_to_buff(std::int8_t data, Writer &writer) noexcept {
+    return write_unsigned<1>(static_cast<std::uint8_t>(data), writer);
+}
+[[nodiscard]] constexpr Error int16_to_buff(std::int16_t data, Writer &writer) noexcept {
+    return write_unsigned<2>(static_cast<std::uint16_t>(data), writer);
+}
+[[nodiscard]] constexpr Error int32_to_buff(std::int32_t data, Writer &writer) noexcept {
+    return varint_to_buff(zigzag_encode_32(data), writer);
+}
+[[nodiscard]] constexpr Error int64_to_buff(std::int64_t data, Writer &writer) noexcept {
+    return varint_to_buff(zigzag_encode_64(data), writer);
+}
+[[nodiscard]] constexpr Error uint8_to_buff(std::uint8_t data, Writer &writer) noexcept {
+    return write_unsigned<1>(data, writer);
+}
+[[nodiscard]] constexpr Error uint16_to_buff(std::uint16_t data, Writer &writer) noexcept {
+    return write_unsigned<2>(data, writer);
+}
+[[nodiscard]] constexpr Error uint32_to_buff(std::uint32_t data, Writer &writer) noexcept {
+    return varint_to_buff(data, writer);
+}
+[[nodiscard]] constexpr Error uint64_to_buff(std::uint64_t data, Writer &writer) noexcept {
+    return varint_to_buff(data, writer);
+}
+[[nodiscard]] inline Error float32_to_buff(float data, Writer &writer) noexcept {
+    std::uint32_t u_val;
+    std::memcpy(&u_val, &data, sizeof(u_val));
+    return write_unsigned<4>(u_val, writer);
+}
+[[nodiscard]] inline Error float64_to_buff(double data, Writer &writer) noexcept {
+    std::uint64_t u_val;
+    std::memcpy(&u_val, &data, sizeof(u_val));
+    return write_unsigned<8>(u_val, writer);
+}
+[[nodiscard]] constexpr Error char_to_buff(char data, Writer &writer) noexcept {
+    return write_unsigned<1>(static_cast<std::uint8_t>(data), writer);
+}
+[[nodiscard]] constexpr Error bool_to_buff(bool data, Writer &writer) noexcept {
+    return write_unsigned<1>(static_cast<std::uint8_t>(data), writer);
+}
+
+// Deserialization
+[[nodiscard]] constexpr Error int8_from_buff(std::int8_t &data, Reader &reader) noexcept {
+    std::uint64_t temp = 0;
+    Error err = read_unsigned<1>(temp, reader);
+    if (err == Error::Success) data = static_cast<std::int8_t>(temp);
+    return err;
+}
+[[nodiscard]] constexpr Error int16_from_buff(std::int16_t &data, Reader &reader) noexcept {
+    std::uint64_t temp = 0;
+    Error err = read_unsigned<2>(temp, reader);
+    if (err == Error::Success) data = static_cast<std::int16_t>(temp);
+    return err;
+}
+[[nodiscard]] constexpr Error int32_from_buff(std::int32_t &data, Reader &reader) noexcept {
+    std::uint64_t temp = 0;
+    Error err = varint_from_buff(temp, reader);
+    if (err == Error::Success) data = zigzag_decode_32(static_cast<std::uint32_t>(temp));
+    return err;
+}
+[[nodiscard]] constexpr Error int64_from_buff(std::int64_t &data, Reader &reader) noexcept {
+    std::uint64_t temp = 0;
+    Error err = varint_from_buff(temp, reader);
+    if (err == Error::Success) data = zigzag_decode_64(temp);
+    return err;
+}
+[[nodiscard]] constexpr Error uint8_from_buff(std::uint8_t &data, Reader &reader) noexcept {
+    std::uint64_t temp = 0;
+    Error err = read_unsigned<1>(temp, reader);
+    if (err == Error::Success) data = static_cast<std::uint8_t>(temp);
+    return err;
+}
+[[nodiscard]] constexpr Error uint16_from_buff(std::uint16_t &data, Reader &reader) noexcept {
+    std::uint64_t temp = 0;
+    Error err = read_unsigned<2>(temp, reader);
+    if (err == Error::Success) data = static_cast<std::uint16_t>(temp);
+    return err;
+}
+[[nodiscard]] constexpr Error uint32_from_buff(std::uint32_t &data, Reader &reader) noexcept {
+    std::uint64_t temp = 0;
+    Error err = varint_from_buff(temp, reader);
+    if (err == Error::Success) data = static_cast<std::uint32_t>(temp);
+    return err;
+}
+[[nodiscard]] constexpr Error uint64_from_buff(std::uint64_t &data, Reader &reader) noexcept {
+    return varint_from_buff(data, reader);
+}
+[[nodiscard]] inline Error float32_from_buff(float &data, Reader &reader) noexcept {
+    std::uint64_t temp = 0;
+    Error err = read_unsigned<4>(temp, reader);
+    if (err == Error::Success) {
+        std::uint32_t u_val = static_cast<std::uint32_t>(temp);
+        std::memcpy(&data, &u_val, sizeof(data));
+    }
+    return err;
+}
+[[nodiscard]] inline Error float64_from_buff(double &data, Reader &reader) noexcept {
+    std::uint64_t temp = 0;
+    Error err = read_unsigned<8>(temp, reader);
+    if (err == Error::Success) {
+        std::memcpy(&data, &temp, sizeof(data));
+    }
+    return err;
+}
+[[nodiscard]] constexpr Error char_from_buff(char &data, Reader &reader) noexcept {
+    std::uint64_t temp = 0;
+    Error err = read_unsigned<1>(temp, reader);
+    if (err == Error::Success) data = static_cast<char>(temp);
+    return err;
+}
+[[nodiscard]] constexpr Error bool_from_buff(bool &data, Reader &reader) noexcept {
+    std::uint64_t temp = 0;
+    Error err = read_unsigned<1>(temp, reader);
+    if (err == Error::Success) data = temp != 0;
+    return err;
+}
+
+/**
+ * @brief Entry of a string dictionary, generated as constexpr tables.
+ */
+struct DictionaryEntry {
+    const char *str;
+    std::size_t len; // Length of the string, without null-terminator
+};
+
+// Marker starting a dictionary index, a literal string never starts with a null byte
+constexpr std::uint8_t DICT_INDEX_MARKER = 0x00;
+
+/**
+ * @brief Returns the index to send for a string, or the dictionary size if it is not in it
+ *        or if its index is not shorter than the string itself.
+ */
+inline std::size_t dict_lookup(span<const DictionaryEntry> dict, const char *data, std::size_t data_len) noexcept {
+    for (std::size_t i = 0; i < dict.size(); i++) {
+        if (dict[i].len == data_len && std::memcmp(dict[i].str, data, data_len) == 0) {
+            return (1 + varint_size(i) < data_len) ? i : dict.size();
+        }
+    }
+    return dict.size();
+}
+
+inline std::size_t dict_string_size(span<const DictionaryEntry> dict, const char *data, std::size_t data_len) noexcept {
+    std::size_t index = dict_lookup(dict, data, data_len);
+    return index == dict.size() ? data_len : 1 + varint_size(index);
+}
+
+[[nodiscard]] inline Error dict_string_to_buff(span<const DictionaryEntry> dict, const char *data, std::size_t data_len, Writer &writer) noexcept {
+    std::size_t index = dict_lookup(dict, data, data_len);
+    if (index == dict.size()) {
+        // Dictionary miss, the string is sent verbatim
+        return writer.put(data, data_len);
+    }
+
+    Error err = writer.put(DICT_INDEX_MARKER);
+    if (err != Error::Success) {
+        return err;
+    }
+    return varint_to_buff(index, writer);
+}
+
+/**
+ * @brief Appends a dictionary-encoded string to a char array.
+ *
+ * @param field_reader Reader over the field value, which is consumed entirely on success.
+ */
+[[nodiscard]] inline Error dict_string_from_buff(span<const DictionaryEntry> dict, span<char> data, std::size_t &count, Reader &field_reader) noexcept {
+    std::size_t field_len = field_reader.remaining();
+    if (field_len == 0 || *field_reader.position() != DICT_INDEX_MARKER) {
+        // Literal string
+        if (field_len > data.size() - count) {
+            return Error::ArraySizeExceeded;
+        }
+        Error err = field_reader.get(data.data() + count, field_len);
+        if (err == Error::Success) {
+            count += field_len;
+        }
+        return err;
+    }
+
+    (void) field_reader.skip(1);
+    std::uint64_t index = 0;
+    Error err = varint_from_buff(index, field_reader);
+    if (err != Error::Success) {
+        return err;
+    }
+    if (field_reader.remaining() != 0 || index >= dict.size()) {
+        return Error::InvalidData;
+    }
+
+    const DictionaryEntry &entry = dict[static_cast<std::size_t>(index)];
+    if (entry.len > data.size() - count) {
+        return Error::ArraySizeExceeded;
+    }
+    std::memcpy(data.data() + count, entry.str, entry.len);
+    count += entry.len;
+    return Error::Success;
+}
+
+/**
+ * @brief Serializes a complete binary message (header + payload) into a caller-provided buffer.
+ *
+ * @param msg The generated message to serialize.
+ * @param out The buffer where the message will be written.
+ * @param written Set to the number of bytes written on success.
+ * @return Error::Success on success, error code otherwise.
+ */
+template <typename Message>
+[[nodiscard]] inline Error encode(const Message &msg, span<std::uint8_t> out, std::size_t &written) noexcept {
+    Writer writer(out);
+    Error err = msg.to_message(writer);
+    if (err == Error::Success) {
+        written = writer.written();
+    }
+    return err;
+}
+
+/**
+ * @brief Deserializes a complete binary message (header + payload) from a caller-provided buffer.
+ *
+ * @param msg The generated message to populate.
+ * @param in The buffer from which to read the message.
+ * @param consumed Set to the number of bytes read on success.
+ * @return Error::Success on success, error code otherwise.
+ */
+template <typename Message>
+[[nodiscard]] inline Error decode(Message &msg, span<const std::uint8_t> in, std::size_t &consumed) noexcept {
+    Reader reader(in);
+    Error err = msg.from_message(reader);
+    if (err == Error::Success) {
+        consumed = reader.consumed();
+    }
+    return err;
+}
+
+} // namespace beta_protoc
+
+#endif // BETA_PROTOC_HPP
@@ -23,6 +23,12 @@ typedef enum {
     BETA_PROTOC_ERR_NULL_ARRAY_POINTER = -8 // NULL pointer passed for an array field
 } beta_protoc_err_t;
 
+// Entry of a string dictionary (generated as static const tables)
+typedef struct {
+    const char *str;
+    size_t len; // Length of the string, without null-terminator
+} beta_protoc_dict_entry_t;
+
 uint32_t zigzag_encode_32(int32_t value);
 int32_t zigzag_decode_32(uint32_t value);
 uint64_t zigzag_encode_64(int64_t value);
@@ -84,6 +90,10 @@ beta_protoc_err_t bool_from_buff(bool *data, uint8_t **buff, size_t *rem_buff);
 beta_protoc_err_t char_from_buff(char *data, uint8_t **buff, size_t *rem_buff);
 beta_protoc_err_t string_from_buff(char *data, size_t data_len, uint8_t **buff, size_t *rem_buff);
 
+size_t dict_string_size(const beta_protoc_dict_entry_t *dict, size_t dict_size, const char *data, size_t data_len);
+beta_protoc_err_t dict_string_to_buff(const beta_protoc_dict_entry_t *dict, size_t dict_size, const char *data, size_t data_len, uint8_t **buff, size_t *rem_buff);
+beta_protoc_err_t dict_string_from_buff(const beta_protoc_dict_entry_t *dict, size_t dict_size, char *data, size_t *data_count, size_t max_count, size_t field_len, uint8_t **buff, size_t *rem_buff);
+
 #ifdef __cplusplus
 }
 #endif
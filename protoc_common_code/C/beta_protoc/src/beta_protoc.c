@@ -343,4 +343,92 @@ beta_protoc_err_t bool_from_buff(bool *data, uint8_t **buff, size_t *rem_buff) {
     beta_protoc_err_t err = _read_unsigned(&temp, 1, buff, rem_buff);
     if (err == BETA_PROTOC_SUCCESS) *data = (bool)temp;
     return err;
-}
\ No newline at end of file
+}
+
+// Marker starting a dictionary index, a literal string never starts with a null byte
+#define DICT_INDEX_MARKER 0x00
+
+// Returns the index of the string in the dictionary, or -1 if it is not in it or if its index is not shorter than the string itself
+static int64_t _dict_lookup(const beta_protoc_dict_entry_t *dict, size_t dict_size, const char *data, size_t data_len) {
+    if (dict == NULL || data == NULL) {
+        return -1;
+    }
+
+    for (size_t i = 0; i < dict_size; i++) {
+        if (dict[i].len == data_len && memcmp(dict[i].str, data, data_len) == 0) {
+            return (1 + varint_size(i) < data_len) ? (int64_t) i : -1;
+        }
+    }
+    return -1;
+}
+
+size_t dict_string_size(const beta_protoc_dict_entry_t *dict, size_t dict_size, const char *data, size_t data_len) {
+    int64_t index = _dict_lookup(dict, dict_size, data, data_len);
+    if (index < 0) {
+        return data_len;
+    }
+    return 1 + varint_size((uint64_t) index);
+}
+
+beta_protoc_err_t dict_string_to_buff(const beta_protoc_dict_entry_t *dict, size_t dict_size, const char *data, size_t data_len, uint8_t **buff, size_t *rem_buff) {
+    if (buff == NULL || *buff == NULL || rem_buff == NULL || data == NULL) {
+        return BETA_PROTOC_ERR_INVALID_ARGS;
+    }
+
+    int64_t index = _dict_lookup(dict, dict_size, data, data_len);
+    if (index < 0) {
+        // Dictionary miss, the string is sent verbatim
+        return string_to_buff(data, data_len, buff, rem_buff);
+    }
+
+    beta_protoc_err_t err = _write_unsigned(DICT_INDEX_MARKER, 1, buff, rem_buff);
+    if (err != BETA_PROTOC_SUCCESS) {
+        return err;
+    }
+    return varint_to_buff((uint64_t) index, buff, rem_buff);
+}
+
+beta_protoc_err_t dict_string_from_buff(const beta_protoc_dict_entry_t *dict, size_t dict_size, char *data, size_t *data_count, size_t max_count, size_t field_len, uint8_t **buff, size_t *rem_buff) {
+    if (buff == NULL || *buff == NULL || rem_buff == NULL || data == NULL || data_count == NULL || *data_count > max_count) {
+        return BETA_PROTOC_ERR_INVALID_ARGS;
+    }
+    if (*rem_buff < field_len) {
+        return BETA_PROTOC_ERR_BUFFER_TOO_SMALL;
+    }
+
+    if (field_len == 0 || **buff != DICT_INDEX_MARKER) {
+        // Literal string
+        if (field_len > max_count - *data_count) {
+            return BETA_PROTOC_ERR_ARRAY_SIZE_EXCEEDED;
+        }
+        beta_protoc_err_t err = string_from_buff(data + *data_count, field_len, buff, rem_buff);
+        if (err != BETA_PROTOC_SUCCESS) {
+            return err;
+        }
+        *data_count += field_len;
+        return BETA_PROTOC_SUCCESS;
+    }
+
+    // Dictionary index, read within the field bounds
+    uint8_t *p_buff = *buff + 1;
+    size_t rem_field = field_len - 1;
+    uint64_t index;
+    beta_protoc_err_t err = varint_from_buff(&index, &p_buff, &rem_field);
+    if (err != BETA_PROTOC_SUCCESS) {
+        return err;
+    }
+    if (rem_field != 0 || dict == NULL || index >= dict_size) {
+        return BETA_PROTOC_ERR_INVALID_DATA;
+    }
+
+    const beta_protoc_dict_entry_t *entry = &dict[index];
+    if (entry->len > max_count - *data_count) {
+        return BETA_PROTOC_ERR_ARRAY_SIZE_EXCEEDED;
+    }
+    memcpy(data + *data_count, entry->str, entry->len);
+    *data_count += entry->len;
+
+    *buff += field_len;
+    *rem_buff -= field_len;
+    return BETA_PROTOC_SUCCESS;
+}
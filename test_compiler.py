@@ -1,7 +1,13 @@
 import pytest
 import json
+import os
+import shutil
+import subprocess
+import sys
+import time
 from pathlib import Path
 from compiler.protoc_schema.schema import ProtocSchema
+from compiler.protoc_schema import SchemaCache, cache as cache_module
 from compiler.core.generator import Generator
 from compiler.common.errors import JSONParsingErrors
 from compiler.core.language import SUPPORTED_LANGUAGES
@@ -185,3 +191,730 @@ def test_duplicate_field_id(tmp_path):
     error = excinfo.value.errors[0]
     assert '"field_a", "field_b" have the same id.' in error.message
     assert error.loc == ('messages', 0, 'fields')
+
+def test_invalid_dictionary(tmp_path):
+    """
+    Test that dictionaries are only accepted on char arrays, with entries fitting in the array.
+    """
+    content = {
+        "messages": [
+            {
+                "name": "MessageWithDictionaries",
+                "id": 1,
+                "fields": [
+                    {"name": "level", "id": 1, "type": "uint8", "dictionary": ["low"]},
+                    {"name": "unit", "id": 2, "type": "char[4]", "dictionary": ["lux", "celsius"]}
+                ]
+            }
+        ]
+    }
+    f = tmp_path / "invalid_dictionary.json"
+    f.write_text(json.dumps(content))
+
+    with pytest.raises(JSONParsingErrors) as excinfo:
+        ProtocSchema.from_json_file(f)
+
+    errors = excinfo.value.errors
+    assert len(errors) == 2
+    assert "only allowed on 'char' array fields" in errors[0].message
+    assert errors[0].loc == ('messages', 0, 'fields', 0)
+    assert '"celsius" does not fit in 4 chars.' in errors[1].message
+    assert errors[1].loc == ('messages', 0, 'fields', 1)
+
+# --- Multi-file schemas ---
+
+def test_schema_imports(tmp_path):
+    """
+    Test that messages defined in imported files (including nested imports) are part of the schema
+    and can be used as field types.
+    """
+    (tmp_path / "teams").mkdir()
+    (tmp_path / "teams" / "common.json").write_text(json.dumps({
+        "messages": [{"name": "Value", "id": 2, "fields": [{"name": "value", "id": 0, "type": "uint32"}]}]
+    }))
+    (tmp_path / "teams" / "sensors.json").write_text(json.dumps({
+        "imports": ["common.json"],
+        "messages": [{"name": "SensorData", "id": 1, "fields": [{"name": "value", "id": 0, "type": "Value"}]}]
+    }))
+    root = tmp_path / "root.json"
+    root.write_text(json.dumps({"imports": ["teams/sensors.json", "teams/common.json"], "messages": []}))
+
+    schema = ProtocSchema.from_json_file(root)
+    assert [msg.name for msg in schema.messages] == ["SensorData", "Value"]
+    assert schema.messages[0].dependencies == ["Value"]
+
+def test_missing_import(tmp_path):
+    """
+    Test that importing a file that does not exist is reported on the import entry.
+    """
+    f = tmp_path / "root.json"
+    f.write_text(json.dumps({"imports": ["missing.json"], "messages": []}))
+
+    with pytest.raises(JSONParsingErrors) as excinfo:
+        ProtocSchema.from_json_file(f)
+
+    error = excinfo.value.errors[0]
+    assert 'Imported file "missing.json" does not exist.' in error.message
+    assert error.loc == ('imports', 0)
+    assert excinfo.value.file == f
+
+def test_duplicate_message_id_across_files(tmp_path):
+    """
+    Test that the uniqueness checks are performed across all the imported files.
+    """
+    (tmp_path / "other.json").write_text(json.dumps({"messages": [{"name": "MessageB", "id": 1, "fields": []}]}))
+    f = tmp_path / "root.json"
+    f.write_text(json.dumps({"imports": ["other.json"], "messages": [{"name": "MessageA", "id": 1, "fields": []}]}))
+
+    with pytest.raises(JSONParsingErrors) as excinfo:
+        ProtocSchema.from_json_file(f)
+
+    assert '"MessageA", "MessageB" have the same id.' in excinfo.value.errors[0].message
+
+def test_schema_cache(valid_json_file, tmp_path, monkeypatch):
+    """
+    Test that an unchanged schema is restored from the cache without being validated again,
+    and that a modified file is validated again.
+    """
+    cache_dir = tmp_path / "cache"
+    first = ProtocSchema.from_json_file(valid_json_file, cache_dir)
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def fail_validation(*args, **kwargs):
+        raise AssertionError("The schema should have been restored from the cache.")
+
+    with monkeypatch.context() as m:
+        m.setattr(ProtocSchema, "model_validate", fail_validation)
+        m.setattr(ProtocSchema, "validate_schema", fail_validation)
+        cached = ProtocSchema.from_json_file(valid_json_file, cache_dir)
+    assert cached.model_dump() == first.model_dump()
+    assert cached == first
+
+    content = json.loads(valid_json_file.read_text())
+    content["messages"][0]["name"] = "RenamedData"
+    valid_json_file.write_text(json.dumps(content))
+    assert ProtocSchema.from_json_file(valid_json_file, cache_dir).messages[0].name == "RenamedData"
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    # Changing the validation code invalidates the entries
+    key = SchemaCache(cache_dir).get_key(valid_json_file)
+    rules_dir = tmp_path / "rules"
+    rules_dir.mkdir()
+    (rules_dir / "rules.py").write_text("RULES = 1\n")
+    monkeypatch.setattr(cache_module, "VALIDATION_SOURCE_DIRS", [*cache_module.VALIDATION_SOURCE_DIRS, rules_dir])
+    assert SchemaCache(cache_dir).get_key(valid_json_file) != key
+
+def test_schema_cache_imports(tmp_path):
+    """
+    Test that changing an imported file invalidates the cached schema of the files importing it.
+    """
+    cache_dir = tmp_path / "cache"
+    common = tmp_path / "common.json"
+    common.write_text(json.dumps({"messages": [{"name": "Common", "id": 1, "fields": []}]}))
+    root = tmp_path / "root.json"
+    root.write_text(json.dumps({"imports": ["common.json"], "messages": [{"name": "Root", "id": 2, "fields": []}]}))
+    ProtocSchema.from_json_file(root, cache_dir)
+
+    # The cross-file checks are performed again
+    common.write_text(json.dumps({"messages": [{"name": "Common", "id": 2, "fields": []}]}))
+    with pytest.raises(JSONParsingErrors):
+        ProtocSchema.from_json_file(root, cache_dir)
+
+    common.write_text(json.dumps({"messages": [{"name": "Renamed", "id": 1, "fields": []}]}))
+    schema = ProtocSchema.from_json_file(root, cache_dir)
+    assert sorted(msg.name for msg in schema.messages) == ["Renamed", "Root"]
+
+def test_schema_cache_speed(tmp_path):
+    """
+    Test that restoring a large schema from the cache is faster than parsing and validating it.
+    """
+    files = 5
+    for file_index in range(files):
+        messages = [{
+            "name": f"Message{file_index}_{msg_index}",
+            "id": file_index * 100 + msg_index,
+            "fields": [{"name": f"field{field_index}", "id": field_index, "type": "uint32"} for field_index in range(20)]
+        } for msg_index in range(100)]
+        imports = [f"part{file_index + 1}.json"] if file_index + 1 < files else []
+        (tmp_path / f"part{file_index}.json").write_text(json.dumps({"imports": imports, "messages": messages}))
+    root = tmp_path / "part0.json"
+    cache_dir = tmp_path / "cache"
+    ProtocSchema.from_json_file(root, cache_dir)
+
+    def best_time(load):
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            load()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    uncached = best_time(lambda: ProtocSchema.from_json_file(root))
+    cached = best_time(lambda: ProtocSchema.from_json_file(root, cache_dir))
+    assert cached < uncached
+
+# --- Generated C code ---
+
+ROOT_DIR = Path(__file__).parent
+C_RUNTIME_DIR = ROOT_DIR / "protoc_common_code" / "C" / "beta_protoc"
+
+def compile_generated_c(c_gen, build_dir):
+    """
+    Compile the C runtime and the generated C sources into object files, returning their paths.
+    """
+    objects = []
+    for src in [C_RUNTIME_DIR / "src" / "beta_protoc.c"] + sorted((c_gen / "src").glob("*.c")):
+        obj = build_dir / (src.stem + ".o")
+        subprocess.run(["gcc", "-std=c11", "-c", str(src), "-o", str(obj),
+                        "-I", str(C_RUNTIME_DIR / "include"), "-I", str(c_gen / "include")], check=True)
+        objects.append(str(obj))
+    return objects
+
+def build_and_run(program, schema, tmp_path, compiler="gcc"):
+    """
+    Generate the C code of a schema (and its C++ code when compiling with g++), build a test program
+    against it, and check that the program runs successfully and prints OK.
+    """
+    cpp = compiler == "g++"
+    f = tmp_path / "schema.json"
+    f.write_text(json.dumps(schema))
+    output_dir = tmp_path / "generated"
+    languages = SUPPORTED_LANGUAGES if cpp else [lang for lang in SUPPORTED_LANGUAGES if lang.name == "C"]
+    Generator(TEMPLATE_DIR, languages).generate(f, output_dir)
+
+    c_gen = output_dir / "C" / "beta_protoc_generated"
+    objects = compile_generated_c(c_gen, tmp_path)
+    include_dirs = [C_RUNTIME_DIR / "include", c_gen / "include"]
+    if cpp:
+        include_dirs += [ROOT_DIR / "protoc_common_code" / "C++" / "beta_protoc" / "include",
+                         output_dir / "C++" / "beta_protoc_generated" / "include"]
+
+    source = tmp_path / ("program.cpp" if cpp else "program.c")
+    source.write_text(program)
+    exe = tmp_path / "program"
+    subprocess.run([compiler, "-std=c++17" if cpp else "-std=c11", "-Wall", "-Wextra", "-Werror", str(source), *objects,
+                    "-o", str(exe), *[arg for include_dir in include_dirs for arg in ("-I", str(include_dir))]], check=True)
+
+    result = subprocess.run([str(exe)], capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout
+    assert result.stdout.strip() == "OK"
+
+DISPATCH_PROGRAM = r"""
+#include <stdio.h>
+#include <string.h>
+
+#include "dispatcher.h"
+
+#define CHECK(cond) do { if (!(cond)) { printf("FAILED: %s (line %d)\n", #cond, __LINE__); return 1; } } while (0)
+
+static int weak_calls = 0;
+static int registered_calls = 0;
+
+// Implementation of the weak callback, registered by default
+void on_value_received(Value *msg, void *ctx) {
+    (void) msg;
+    (void) ctx;
+    weak_calls++;
+}
+
+static void sensor_data_handler(SensorData *msg, void *ctx) {
+    *(uint32_t *) ctx = msg->id;
+    registered_calls++;
+}
+
+int main(void) {
+    uint8_t buffer[256];
+    uint8_t *p_buff = buffer;
+    size_t rem_buff = sizeof(buffer);
+
+    Value value = {0};
+    value.value = 12;
+    SensorData sensor_data = {0};
+    sensor_data.id = 42;
+    CHECK(value_to_message(&value, &p_buff, &rem_buff) == 0);
+    CHECK(sensor_data_to_message(&sensor_data, &p_buff, &rem_buff) == 0);
+    size_t len = sizeof(buffer) - rem_buff;
+
+    // Without registered handler, SensorData messages are skipped
+    uint32_t received_id = 0;
+    p_buff = buffer;
+    rem_buff = len;
+    CHECK(protoc_dispatch(&p_buff, &rem_buff, &received_id) == DISPATCHER_SUCCESS);
+    CHECK(protoc_dispatch(&p_buff, &rem_buff, &received_id) == DISPATCHER_SUCCESS);
+    CHECK(rem_buff == 0 && weak_calls == 1 && registered_calls == 0);
+
+    // Registered handlers are called, unregistered ones are skipped
+    protoc_register_sensor_data_handler(sensor_data_handler);
+    protoc_unregister_value_handler();
+    p_buff = buffer;
+    rem_buff = len;
+    CHECK(protoc_dispatch(&p_buff, &rem_buff, &received_id) == DISPATCHER_SUCCESS);
+    CHECK(protoc_dispatch(&p_buff, &rem_buff, &received_id) == DISPATCHER_SUCCESS);
+    CHECK(rem_buff == 0 && weak_calls == 1 && registered_calls == 1 && received_id == 42);
+
+    // Truncated skipped messages and unknown IDs are reported
+    p_buff = buffer;
+    rem_buff = 3;
+    CHECK(protoc_dispatch(&p_buff, &rem_buff, NULL) == BETA_PROTOC_ERR_BUFFER_TOO_SMALL);
+    buffer[1] = 7;
+    p_buff = buffer;
+    rem_buff = len;
+    CHECK(protoc_dispatch(&p_buff, &rem_buff, NULL) == DISPATCHER_ERR_UNKNOWN_MESSAGE_ID);
+
+    printf("OK\n");
+    return 0;
+}
+"""
+
+@pytest.mark.skipif(not shutil.which("gcc"), reason="gcc is required")
+def test_c_dispatcher_handlers(tmp_path):
+    """
+    Test that the C dispatcher calls the registered handlers (the weak callbacks by default)
+    and skips the messages without handler.
+    """
+    schema = json.loads((ROOT_DIR / "example" / "msg.json").read_text())
+    build_and_run(DISPATCH_PROGRAM, schema, tmp_path)
+
+SPARSE_DISPATCH_PROGRAM = r"""
+#include <stdio.h>
+
+#include "dispatcher.h"
+
+#define CHECK(cond) do { if (!(cond)) { printf("FAILED: %s (line %d)\n", #cond, __LINE__); return 1; } } while (0)
+
+static uint32_t received = 0;
+
+void on_low_received(Low *msg, void *ctx) {
+    (void) ctx;
+    received += msg->value;
+}
+
+static void high_handler(High *msg, void *ctx) {
+    (void) ctx;
+    received += msg->value * 10;
+}
+
+int main(void) {
+    uint8_t buffer[64];
+    uint8_t *p_buff = buffer;
+    size_t rem_buff = sizeof(buffer);
+
+    Low low = {0};
+    low.value = 1;
+    High high = {0};
+    high.value = 2;
+    CHECK(high_to_message(&high, &p_buff, &rem_buff) == 0);
+    CHECK(low_to_message(&low, &p_buff, &rem_buff) == 0);
+    size_t len = sizeof(buffer) - rem_buff;
+
+    protoc_register_high_handler(high_handler);
+    p_buff = buffer;
+    rem_buff = len;
+    CHECK(protoc_dispatch(&p_buff, &rem_buff, NULL) == DISPATCHER_SUCCESS);
+    CHECK(protoc_dispatch(&p_buff, &rem_buff, NULL) == DISPATCHER_SUCCESS);
+    CHECK(rem_buff == 0 && received == 21);
+
+    // IDs between the sparse ones are unknown
+    buffer[1] = 2;
+    p_buff = buffer;
+    rem_buff = len;
+    CHECK(protoc_dispatch(&p_buff, &rem_buff, NULL) == DISPATCHER_ERR_UNKNOWN_MESSAGE_ID);
+
+    printf("OK\n");
+    return 0;
+}
+"""
+
+@pytest.mark.skipif(not shutil.which("gcc"), reason="gcc is required")
+def test_c_dispatcher_sparse_ids(tmp_path):
+    """
+    Test that the C dispatcher handles sparse message IDs with tables sized by the number of messages,
+    and that its tables of deserialization functions are read-only.
+    """
+    schema = {"messages": [
+        {"name": "Low", "id": 1, "fields": [{"name": "value", "id": 0, "type": "uint32"}]},
+        {"name": "High", "id": 65535, "fields": [{"name": "value", "id": 0, "type": "uint32"}]}
+    ]}
+    build_and_run(SPARSE_DISPATCH_PROGRAM, schema, tmp_path)
+
+    # The dispatcher builds cleanly with the highest possible message ID, and only its handlers are writable
+    c_gen = tmp_path / "generated" / "C" / "beta_protoc_generated"
+    obj = tmp_path / "dispatcher_strict.o"
+    subprocess.run(["gcc", "-std=c11", "-fno-pic", "-Wall", "-Wextra", "-Werror", "-c", str(c_gen / "src" / "dispatcher.c"),
+                    "-o", str(obj), "-I", str(C_RUNTIME_DIR / "include"), "-I", str(c_gen / "include")], check=True)
+
+    if shutil.which("size"):
+        sections = subprocess.run(["size", "-A", str(obj)], capture_output=True, text=True, check=True).stdout
+        data_size = sum(int(line.split()[1]) for line in sections.splitlines() if line.startswith((".data", ".bss")))
+        assert data_size <= 2 * 8, sections
+
+DICTIONARY_PROGRAM = r"""
+#include <stdio.h>
+#include <string.h>
+
+#include "Value.h"
+
+#define CHECK(cond) do { if (!(cond)) { printf("FAILED: %s (line %d)\n", #cond, __LINE__); return 1; } } while (0)
+
+int main(void) {
+    uint8_t buffer[64];
+    uint8_t *p_buff = buffer;
+    size_t rem_buff = sizeof(buffer);
+
+    // Dictionary hits are sent as a null byte followed by their index
+    Value value = {0};
+    value.value = 12;
+    strcpy(value.unit, "percent");
+    value.unit_count = sizeof(value.unit);
+    CHECK(value_to_message(&value, &p_buff, &rem_buff) == 0);
+    const uint8_t expected[] = {1, 1, 0, 7, 0, 1, 12, 1, 2, 0, 2};
+    CHECK(sizeof(buffer) - rem_buff == sizeof(expected) && memcmp(buffer, expected, sizeof(expected)) == 0);
+
+    Value decoded;
+    memset(&decoded, 'x', sizeof(decoded));
+    p_buff = buffer;
+    rem_buff = sizeof(expected);
+    CHECK(value_from_message(&decoded, &p_buff, &rem_buff) == 0);
+    CHECK(rem_buff == 0 && decoded.value == 12 && decoded.unit_count == 7 && strcmp(decoded.unit, "percent") == 0);
+
+    // Dictionary misses are sent verbatim
+    const char *literals[] = {"kelvin", ""};
+    for (size_t i = 0; i < 2; i++) {
+        strcpy(value.unit, literals[i]);
+        p_buff = buffer;
+        rem_buff = sizeof(buffer);
+        CHECK(value_to_message(&value, &p_buff, &rem_buff) == 0);
+        CHECK(sizeof(buffer) - rem_buff == 9 + strlen(literals[i]) && memcmp(buffer + 9, literals[i], strlen(literals[i])) == 0);
+
+        p_buff = buffer;
+        rem_buff = sizeof(buffer) - rem_buff;
+        CHECK(value_from_message(&decoded, &p_buff, &rem_buff) == 0);
+        CHECK(rem_buff == 0 && strcmp(decoded.unit, literals[i]) == 0);
+    }
+
+    // Out of range indexes are rejected
+    const uint8_t invalid[] = {1, 1, 0, 4, 1, 2, 0, 5};
+    p_buff = (uint8_t *) invalid;
+    rem_buff = sizeof(invalid);
+    CHECK(value_from_message(&decoded, &p_buff, &rem_buff) == BETA_PROTOC_ERR_INVALID_DATA);
+
+    printf("OK\n");
+    return 0;
+}
+"""
+
+@pytest.mark.skipif(not shutil.which("gcc"), reason="gcc is required")
+def test_c_dictionary_strings(tmp_path):
+    """
+    Test that the generated C code sends the dictionary entries of a char array as their index,
+    falls back to the literal string otherwise, and expands the index back when decoding.
+    """
+    schema = json.loads((ROOT_DIR / "example" / "msg.json").read_text())
+    build_and_run(DICTIONARY_PROGRAM, schema, tmp_path)
+
+# --- C / C++ wire compatibility ---
+
+CROSS_SCHEMA = {
+    "messages": [
+        {
+            "name": "Inner",
+            "id": 1,
+            "fields": [
+                {"name": "a", "id": 0, "type": "int32"},
+                {"name": "label", "id": 1, "type": "char[16]", "dictionary": ["one", "two", "three"]}
+            ]
+        },
+        {
+            "name": "Empty",
+            "id": 2,
+            "fields": []
+        },
+        {
+            "name": "Outer",
+            "id": 300,
+            "fields": [
+                {"name": "u8", "id": 0, "type": "uint8"},
+                {"name": "u16", "id": 1, "type": "uint16"},
+                {"name": "u32", "id": 2, "type": "uint32"},
+                {"name": "u64", "id": 3, "type": "uint64"},
+                {"name": "i8", "id": 4, "type": "int8"},
+                {"name": "i16", "id": 5, "type": "int16"},
+                {"name": "i32", "id": 6, "type": "int32"},
+                {"name": "i64", "id": 7, "type": "int64"},
+                {"name": "f32", "id": 8, "type": "float32"},
+                {"name": "f64", "id": 9, "type": "float64"},
+                {"name": "flag", "id": 10, "type": "bool"},
+                {"name": "letter", "id": 11, "type": "char"},
+                {"name": "name", "id": 12, "type": "char[32]", "dictionary": ["sensor", "gateway"]},
+                {"name": "samples", "id": 13, "type": "int32[4]"},
+                {"name": "raw", "id": 14, "type": "uint8[]"},
+                {"name": "values", "id": 15, "type": "float64[]"},
+                {"name": "inner", "id": 16, "type": "Inner"},
+                {"name": "inners", "id": 200, "type": "Inner[2]"}
+            ]
+        }
+    ]
+}
+
+CROSS_PROGRAM = r"""
+#include <cstdio>
+#include <cstring>
+
+#include "Empty.h"
+#include "Outer.h"
+#include "dispatcher.hpp"
+
+namespace gen = beta_protoc_generated;
+
+template <typename... Fs>
+struct overloaded : Fs... {
+    using Fs::operator()...;
+};
+template <typename... Fs>
+overloaded(Fs...) -> overloaded<Fs...>;
+
+#define CHECK(cond) do { if (!(cond)) { std::printf("FAILED: %s (line %d)\n", #cond, __LINE__); return 1; } } while (0)
+
+int main() {
+    // --- Encode with C ---
+    uint8_t c_raw[8] = {1, 2, 3, 250};
+    double c_values[4] = {1.5, -2.25, 1e300};
+    Outer c_msg;
+    std::memset(&c_msg, 0, sizeof(c_msg));
+    c_msg.u8 = 200; c_msg.u16 = 60000; c_msg.u32 = 4000000000u; c_msg.u64 = 18000000000000000000ull;
+    c_msg.i8 = -100; c_msg.i16 = -30000; c_msg.i32 = -123456; c_msg.i64 = -9000000000000000000ll;
+    c_msg.f32 = 3.5f; c_msg.f64 = -0.125; c_msg.flag = true; c_msg.letter = 'x';
+    std::strcpy(c_msg.name, "gateway"); c_msg.name_count = 32;
+    c_msg.samples[0] = -1; c_msg.samples[1] = 64; c_msg.samples[2] = 1 << 30; c_msg.samples_count = 3;
+    c_msg.raw = c_raw; c_msg.raw_count = 4; c_msg.raw_max_count = 8;
+    c_msg.values = c_values; c_msg.values_count = 3; c_msg.values_max_count = 4;
+    c_msg.inner.a = -7; std::strcpy(c_msg.inner.label, "in"); c_msg.inner.label_count = 16;
+    c_msg.inners[0].a = 1; std::strcpy(c_msg.inners[0].label, "one"); c_msg.inners[0].label_count = 16;
+    c_msg.inners[1].a = 2; std::strcpy(c_msg.inners[1].label, "two"); c_msg.inners[1].label_count = 16;
+    c_msg.inners_count = 2;
+
+    uint8_t c_buff[512];
+    uint8_t *p_buff = c_buff;
+    size_t rem_buff = sizeof(c_buff);
+    CHECK(outer_to_message(&c_msg, &p_buff, &rem_buff) == 0);
+    size_t c_len = sizeof(c_buff) - rem_buff;
+
+    // --- Decode with C++ ---
+    std::uint8_t cpp_raw[8];
+    double cpp_values[4];
+    gen::Outer cpp_msg{};
+    cpp_msg.raw = beta_protoc::span<std::uint8_t>(cpp_raw);
+    cpp_msg.values = beta_protoc::span<double>(cpp_values);
+    std::size_t consumed = 0;
+    CHECK(beta_protoc::decode(cpp_msg, beta_protoc::span<const std::uint8_t>(c_buff, c_len), consumed) == beta_protoc::Error::Success);
+    CHECK(consumed == c_len);
+    CHECK(cpp_msg.u8 == 200 && cpp_msg.u16 == 60000 && cpp_msg.u32 == 4000000000u && cpp_msg.u64 == 18000000000000000000ull);
+    CHECK(cpp_msg.i8 == -100 && cpp_msg.i16 == -30000 && cpp_msg.i32 == -123456 && cpp_msg.i64 == -9000000000000000000ll);
+    CHECK(cpp_msg.f32 == 3.5f && cpp_msg.f64 == -0.125 && cpp_msg.flag && cpp_msg.letter == 'x');
+    CHECK(cpp_msg.name_count == 7 && std::strcmp(cpp_msg.name.data(), "gateway") == 0);
+    CHECK(cpp_msg.samples_count == 3 && cpp_msg.samples[0] == -1 && cpp_msg.samples[1] == 64 && cpp_msg.samples[2] == (1 << 30));
+    CHECK(cpp_msg.raw_count == 4 && cpp_raw[3] == 250);
+    CHECK(cpp_msg.values_count == 3 && cpp_values[1] == -2.25 && cpp_values[2] == 1e300);
+    CHECK(cpp_msg.inner.a == -7 && std::strcmp(cpp_msg.inner.label.data(), "in") == 0);
+    CHECK(cpp_msg.inners_count == 2 && cpp_msg.inners[1].a == 2 && std::strcmp(cpp_msg.inners[1].label.data(), "two") == 0);
+
+    // --- Re-encode with C++: must be byte-identical ---
+    std::uint8_t cpp_buff[512];
+    std::size_t cpp_len = 0;
+    CHECK(beta_protoc::encode(cpp_msg, beta_protoc::span<std::uint8_t>(cpp_buff), cpp_len) == beta_protoc::Error::Success);
+    CHECK(cpp_len == c_len && std::memcmp(cpp_buff, c_buff, c_len) == 0);
+
+    // --- Decode with C ---
+    uint8_t back_raw[8];
+    double back_values[4];
+    Outer back;
+    std::memset(&back, 0, sizeof(back));
+    back.raw = back_raw; back.raw_max_count = 8;
+    back.values = back_values; back.values_max_count = 4;
+    p_buff = cpp_buff;
+    rem_buff = cpp_len;
+    CHECK(outer_from_message(&back, &p_buff, &rem_buff) == 0);
+    CHECK(rem_buff == 0);
+    CHECK(back.i64 == c_msg.i64 && back.u64 == c_msg.u64 && back.f64 == c_msg.f64);
+    CHECK(std::strcmp(back.name, "gateway") == 0 && back.values_count == 3 && back.inners_count == 2);
+
+    // --- Messages without fields ---
+    Empty c_empty;
+    uint8_t empty_buff[8];
+    p_buff = empty_buff;
+    rem_buff = sizeof(empty_buff);
+    CHECK(empty_to_message(&c_empty, &p_buff, &rem_buff) == 0);
+    size_t empty_len = sizeof(empty_buff) - rem_buff;
+    gen::Empty cpp_empty{};
+    CHECK(beta_protoc::decode(cpp_empty, beta_protoc::span<const std::uint8_t>(empty_buff, empty_len), consumed) == beta_protoc::Error::Success);
+    CHECK(consumed == empty_len && empty_len == 4);
+
+    // --- Dispatch, with caller-provided storage for the dynamic arrays ---
+    std::uint8_t stream[sizeof(c_buff) + sizeof(empty_buff)];
+    std::memcpy(stream, c_buff, c_len);
+    std::memcpy(stream + c_len, empty_buff, empty_len);
+    beta_protoc::Reader stream_reader(beta_protoc::span<const std::uint8_t>(stream, c_len + empty_len));
+    std::uint8_t dispatch_raw[8];
+    double dispatch_values[4];
+    int handled = 0;
+    auto handler = overloaded{
+        [&](gen::Outer &msg) { handled += msg.raw_count == 4 && msg.raw[3] == 250 && msg.values_count == 3 && msg.values[2] == 1e300; },
+        [&](gen::Empty &) { handled += 10; },
+    };
+    auto storage = [&](gen::Outer &msg) {
+        msg.raw = beta_protoc::span<std::uint8_t>(dispatch_raw);
+        msg.values = beta_protoc::span<double>(dispatch_values);
+    };
+    CHECK(gen::protoc_dispatch(stream_reader, handler, storage) == 0);
+    CHECK(gen::protoc_dispatch(stream_reader, handler, storage) == 0);
+    CHECK(handled == 11 && stream_reader.remaining() == 0);
+
+    // Messages the handler does not accept are skipped
+    stream_reader = beta_protoc::Reader(beta_protoc::span<const std::uint8_t>(stream, c_len + empty_len));
+    CHECK(gen::protoc_dispatch(stream_reader, [&](gen::Empty &) { handled++; }) == 0);
+    CHECK(gen::protoc_dispatch(stream_reader, [&](gen::Empty &) { handled++; }) == 0);
+    CHECK(handled == 12 && stream_reader.remaining() == 0);
+
+    // --- Errors are reported identically ---
+    std::uint8_t small[4];
+    std::size_t unused = 0;
+    CHECK(static_cast<int>(beta_protoc::encode(cpp_msg, beta_protoc::span<std::uint8_t>(small), unused)) == BETA_PROTOC_ERR_BUFFER_TOO_SMALL);
+
+    std::printf("OK\n");
+    return 0;
+}
+"""
+
+@pytest.mark.skipif(not (shutil.which("gcc") and shutil.which("g++")), reason="gcc and g++ are required")
+def test_c_cpp_wire_compatibility(tmp_path):
+    """
+    Test that messages encoded by the generated C code are decoded by the generated C++ code and vice versa,
+    and that both produce byte-identical messages.
+    """
+    build_and_run(CROSS_PROGRAM, CROSS_SCHEMA, tmp_path, compiler="g++")
+
+# --- CPython extension module ---
+
+EXTENSION_SCRIPT = r"""
+import beta_protoc_generated as gen
+
+inner = gen.Inner((-7, "in"))
+outer = gen.Outer((200, 60000, 4000000000, 18000000000000000000, -100, -30000, -123456, -9000000000000000000,
+                   3.5, -0.125, True, "x", "gateway", (-1, 64, 1 << 30), (1, 2, 3, 250), (1.5, -2.25, 1e300),
+                   inner, (gen.Inner((1, "one")), gen.Inner((2, "two")))))
+assert gen.Outer.ID == 300
+
+data = gen.encode(outer)
+assert gen.decode(data) == outer
+assert gen.decode(memoryview(bytearray(data))) == outer
+
+batch = gen.encode_all([outer, inner, outer])
+assert batch == data + gen.encode(inner) + data
+assert gen.decode_all(memoryview(batch)) == [outer, inner, outer]
+assert gen.decode_all(b"") == []
+
+try:
+    gen.decode(data[:-1])
+    raise AssertionError("Truncated message decoded")
+except gen.ProtocError as e:
+    assert e.args[0] < 0
+
+try:
+    gen.encode(gen.Inner((1, "x" * 17)))
+    raise AssertionError("Too long string encoded")
+except ValueError:
+    pass
+
+print("OK")
+"""
+
+def build_python_extension(schema, tmp_path):
+    """
+    Generate the CPython extension module of a schema and build it with its setup.py, returning the directory containing it.
+    """
+    f = tmp_path / "schema.json"
+    f.write_text(json.dumps(schema))
+    output_dir = tmp_path / "generated"
+    Generator(TEMPLATE_DIR, [lang for lang in SUPPORTED_LANGUAGES if lang.name == "C"], python_extension=True).generate(f, output_dir)
+
+    ext_dir = output_dir / "C" / "beta_protoc_generated" / "python"
+    lib_dir = tmp_path / "lib"
+    env = dict(os.environ, BETA_PROTOC_DIR=str(C_RUNTIME_DIR))
+    subprocess.run([sys.executable, "setup.py", "-q", "build_ext", "--build-lib", str(lib_dir), "--build-temp", str(tmp_path / "build")],
+                   cwd=ext_dir, env=env, check=True)
+    return lib_dir
+
+@pytest.mark.skipif(not shutil.which("gcc"), reason="gcc is required")
+def test_python_extension(tmp_path):
+    """
+    Test that the generated CPython extension module builds with its setup.py and round-trips all the field kinds,
+    decoding single and concatenated messages from any bytes-like object.
+    """
+    pytest.importorskip("setuptools")
+    lib_dir = build_python_extension(CROSS_SCHEMA, tmp_path)
+
+    result = subprocess.run([sys.executable, "-c", EXTENSION_SCRIPT], cwd=lib_dir, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "OK"
+
+NESTED_SCHEMA = {
+    "messages": [
+        {
+            "name": "Item",
+            "id": 1,
+            "fields": [
+                {"name": "data", "id": 0, "type": "uint8[]"},
+                {"name": "weights", "id": 1, "type": "float64[]"},
+                {"name": "unit", "id": 2, "type": "char[]", "dictionary": ["celsius", "fahrenheit"]}
+            ]
+        },
+        {
+            "name": "Outer",
+            "id": 2,
+            "fields": [
+                {"name": "items", "id": 0, "type": "Item[]"},
+                {"name": "blob", "id": 1, "type": "uint8[]"},
+                {"name": "pair", "id": 2, "type": "Item[2]"},
+                {"name": "single", "id": 3, "type": "Item"}
+            ]
+        }
+    ]
+}
+
+NESTED_EXTENSION_SCRIPT = r"""
+import resource
+import beta_protoc_generated as gen
+
+empty = gen.Item(((), (), ""))
+outer = gen.Outer(((gen.Item(((1, 2, 3), (0.5,), "celsius")), empty, gen.Item(((), (1.0, 2.0), "kelvin"))), (9,) * 1000,
+                   (gen.Item(((7,), (), "fahrenheit")), gen.Item(((8, 8), (3.0,), ""))), gen.Item(((4,) * 300, (), "celsius"))))
+assert gen.decode(gen.encode(outer)) == outer
+
+# Dictionary hits are sent as an index, shorter than the string they expand to
+unit = gen.Item(((), (), "fahrenheit"))
+assert len(gen.encode(unit)) < len(gen.encode(gen.Item(((), (), "fahrenhei"))))
+assert gen.decode(gen.encode(unit)) == unit
+
+# The decode storage is linear in the payload size, even with nested dynamic arrays
+big = gen.Outer(((gen.Item(((1,), (), "celsius")),), (0,) * 1000000, (), empty))
+data = gen.encode(big)
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+assert gen.decode(data) == big
+rss_growth_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024
+assert rss_growth_mb < 100, rss_growth_mb
+
+print("OK")
+"""
+
+@pytest.mark.skipif(not shutil.which("gcc"), reason="gcc is required")
+def test_python_extension_nested_dynamic_arrays(tmp_path):
+    """
+    Test that the CPython extension module decodes dynamic arrays of messages containing dynamic arrays,
+    with a storage linear in the payload size.
+    """
+    pytest.importorskip("setuptools")
+    lib_dir = build_python_extension(NESTED_SCHEMA, tmp_path)
+
+    result = subprocess.run([sys.executable, "-c", NESTED_EXTENSION_SCRIPT], cwd=lib_dir, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "OK"